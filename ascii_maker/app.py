@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
-import asyncio
 import platform
+import queue
 import subprocess
+import threading
+import time
 from pathlib import Path
 from typing import Iterator
 
@@ -29,8 +31,15 @@ from ascii_maker.tui.controls import ControlPanel
 from ascii_maker.tui.preview import AsciiPreview
 from ascii_maker.tui.timeline import Timeline
 from ascii_maker.utils.cache import FrameCache
+from ascii_maker.utils.parallel import map_ordered, prefetch
 from ascii_maker.utils.terminal import fit_to_terminal
 
+# Minimum seconds between status bar updates during long-running work
+STATUS_UPDATE_INTERVAL = 0.1
+
+# Seconds to wait for further navigation before rendering the current frame
+RENDER_COALESCE_DELAY = 0.016
+
 
 class SaveScreen(ModalScreen[str | None]):
     """Modal screen for saving output."""
@@ -150,6 +159,8 @@ class AsciiMakerApp(App):
         self._reader: GifReader | Mp4Reader | None = None
         self._cache = FrameCache(max_size=64)
         self._current_frame_idx = 0
+        self._frame_count = 0
+        self._render_pending = False
         self._playing = False
         self._playback_worker: Worker | None = None
         self._preview_worker: Worker | None = None
@@ -167,32 +178,39 @@ class AsciiMakerApp(App):
         yield Footer()
 
     def on_mount(self) -> None:
+        # Widgets touched on every frame or event; looked up once, not per use
+        self._preview = self.query_one(AsciiPreview)
+        self._panel = self.query_one(ControlPanel)
+        self._timeline = self.query_one(Timeline)
+        self._status_bar = self.query_one("#status-bar", Static)
         if self._input_path:
             self._load_file(self._input_path)
 
     def _load_file(self, path: str) -> None:
         """Load a media file."""
         try:
-            self._reader = open_media(path)
-            info = self._reader.info
+            reader = open_media(path)
+            if self._reader is not None:
+                # Release the previous file's decoder before replacing it
+                self._reader.close()
+            self._reader = reader
+            info = reader.info
             self.title = f"ascii_maker - {info.path.name}"
 
             # Calculate dimensions based on available preview space
-            preview = self.query_one(AsciiPreview)
-            pw = preview.size.width or 80
-            ph = preview.size.height or 24
+            pw = self._preview.size.width or 80
+            ph = self._preview.size.height or 24
             char_w, char_h = fit_to_terminal(
                 info.width, info.height, max_width=pw - 2, max_height=ph - 2
             )
 
             # Update settings dimensions
-            panel = self.query_one(ControlPanel)
-            panel.update_dimensions(char_w, char_h)
-            self._settings = panel.settings
+            self._panel.update_dimensions(char_w, char_h)
+            self._settings = self._panel.settings
 
             # Update timeline
-            timeline = self.query_one(Timeline)
-            timeline.set_total_frames(info.frame_count)
+            self._timeline.set_total_frames(info.frame_count)
+            self._frame_count = info.frame_count
 
             # Clear cache and show first frame
             self._cache.clear()
@@ -204,11 +222,22 @@ class AsciiMakerApp(App):
             self._update_status(f"Error: {e}")
 
     def _update_status(self, text: str) -> None:
-        try:
-            status = self.query_one("#status-bar", Static)
-            status.update(text)
-        except Exception:
-            pass
+        self._status_bar.update(text)
+
+    def _request_render(self) -> None:
+        """Render the current frame soon, coalescing rapid requests.
+
+        Key-repeat while scrubbing fires faster than frames can be processed,
+        so only the latest index within one short interval is rendered.
+        """
+        if self._render_pending:
+            return
+        self._render_pending = True
+        self.set_timer(RENDER_COALESCE_DELAY, self._flush_render)
+
+    def _flush_render(self) -> None:
+        self._render_pending = False
+        self._render_current_frame()
 
     @work(thread=True, exclusive=True, group="preview")
     def _render_current_frame(self) -> None:
@@ -232,6 +261,8 @@ class AsciiMakerApp(App):
         try:
             raw_frame = self._reader.seek(idx)
             processed = process_frame(raw_frame, settings)
+            # Build the terminal escapes here rather than on the UI thread
+            processed.build_colored_lines()
             self._cache.put(idx, cache_key, processed)
             if not worker.is_cancelled:
                 self.call_from_thread(self._display_frame, processed)
@@ -241,57 +272,99 @@ class AsciiMakerApp(App):
 
     def _display_frame(self, frame: ProcessedFrame) -> None:
         """Display a processed frame (called on main thread)."""
-        preview = self.query_one(AsciiPreview)
-        preview.update_frame(frame)
-        timeline = self.query_one(Timeline)
-        timeline.set_frame(frame.index)
+        self._preview.update_frame(frame)
+        self._timeline.set_frame(frame.index)
 
-    @work(thread=True, exclusive=True, group="playback")
-    def _playback_loop(self) -> None:
-        """Playback loop running in a background thread."""
+    @work(thread=True, exclusive=True, group="decode")
+    def _decode_loop(
+        self, frames: queue.Queue[ProcessedFrame | None], stop: threading.Event
+    ) -> None:
+        """Decode and process frames ahead of playback in a background thread.
+
+        Pushes frames in playback order onto ``frames``; a ``None`` entry
+        signals a decode error. The bounded queue keeps at most one frame
+        ready beyond the one being displayed.
+        """
         if self._reader is None:
             return
 
         worker = get_current_worker()
-        info = self._reader.info
+        reader = self._reader
+        # MP4s with missing metadata report no frames; keep the modulo defined
+        frame_count = max(self._frame_count, 1)
         settings = self._settings
         cache_key = settings.hash()
+        idx = self._current_frame_idx
 
-        while self._playing and not worker.is_cancelled:
-            idx = self._current_frame_idx
-
-            # Check cache
-            cached = self._cache.get(idx, cache_key)
-            if cached is not None:
-                frame = cached
-            else:
+        while not stop.is_set() and not worker.is_cancelled:
+            frame = self._cache.get(idx, cache_key)
+            if frame is None:
                 try:
-                    raw_frame = self._reader.seek(idx)
+                    raw_frame = reader.seek(idx)
                     frame = process_frame(raw_frame, settings)
+                    frame.build_colored_lines()
                     self._cache.put(idx, cache_key, frame)
                 except Exception:
+                    frame = None
+
+            while not stop.is_set() and not worker.is_cancelled:
+                try:
+                    frames.put(frame, timeout=0.1)
                     break
+                except queue.Full:
+                    continue
+
+            if frame is None:
+                return
+            idx = (idx + 1) % frame_count
+
+    @work(thread=True, exclusive=True, group="playback")
+    def _playback_loop(
+        self, frames: queue.Queue[ProcessedFrame | None], stop: threading.Event
+    ) -> None:
+        """Playback loop running in a background thread.
 
-            if worker.is_cancelled:
-                break
+        Displays frames produced by ``_decode_loop`` and paces them, so the
+        next frame is processed while the current one is on screen.
+        """
+        if self._reader is None:
+            return
 
-            self.call_from_thread(self._display_frame, frame)
+        worker = get_current_worker()
+        deadline = time.monotonic()
 
-            # Wait for frame duration
-            import time
-            time.sleep(frame.duration_ms / 1000.0)
+        try:
+            while self._playing and not worker.is_cancelled:
+                try:
+                    frame = frames.get(timeout=0.1)
+                except queue.Empty:
+                    continue
+                if frame is None or worker.is_cancelled:
+                    break
 
-            # Advance
-            self._current_frame_idx += 1
-            if self._current_frame_idx >= info.frame_count:
-                self._current_frame_idx = 0  # Loop
+                self.call_from_thread(self._display_frame, frame)
+
+                # Wait for frame duration, measured against a running deadline
+                # so per-frame overhead doesn't accumulate as drift
+                deadline += frame.duration_ms / 1000.0
+                remaining = deadline - time.monotonic()
+                if remaining > 0:
+                    time.sleep(remaining)
+                else:
+                    deadline = time.monotonic()  # Resync after a stall
+
+                # Advance
+                self._current_frame_idx = frame.index + 1
+                if self._current_frame_idx >= self._frame_count:
+                    self._current_frame_idx = 0  # Loop
+        finally:
+            stop.set()
 
         self.call_from_thread(self._on_playback_stopped)
 
     def _on_playback_stopped(self) -> None:
         self._playing = False
-        timeline = self.query_one(Timeline)
-        timeline.set_playing(False)
+        self._timeline.set_playing(False)
 
     # --- Actions ---
 
@@ -299,29 +372,29 @@ class AsciiMakerApp(App):
         if self._reader is None:
             return
         self._playing = not self._playing
-        timeline = self.query_one(Timeline)
-        timeline.set_playing(self._playing)
+        self._timeline.set_playing(self._playing)
         if self._playing:
-            self._playback_loop()
+            frames: queue.Queue[ProcessedFrame | None] = queue.Queue(maxsize=2)
+            stop = threading.Event()
+            self._decode_loop(frames, stop)
+            self._playback_loop(frames, stop)
         self._update_status("Playing" if self._playing else "Paused")
 
     def action_prev_frame(self) -> None:
         if self._reader is None:
             return
         self._playing = False
-        info = self._reader.info
         self._current_frame_idx = max(0, self._current_frame_idx - 1)
-        self._render_current_frame()
+        self._request_render()
 
     def action_next_frame(self) -> None:
         if self._reader is None:
             return
         self._playing = False
-        info = self._reader.info
         self._current_frame_idx = min(
-            info.frame_count - 1, self._current_frame_idx + 1
+            self._frame_count - 1, self._current_frame_idx + 1
         )
-        self._render_current_frame()
+        self._request_render()
 
     def action_save(self) -> None:
         if self._reader is None:
@@ -348,23 +421,50 @@ class AsciiMakerApp(App):
         worker = get_current_worker()
         info = self._reader.info
         settings = self._settings
+        cache_key = settings.hash()
         out = Path(output_path)
 
         self.call_from_thread(self._update_status, "Saving...")
 
+        def processed_frames() -> Iterator[ProcessedFrame]:
+            # Reuse frames already processed for the preview; if they cover
+            # the whole clip, skip decoding entirely
+            cached = [self._cache.get(i, cache_key) for i in range(info.frame_count)]
+            if cached and all(frame is not None for frame in cached):
+                yield from cached
+                return
+
+            def process(raw_frame: Frame) -> ProcessedFrame:
+                processed = self._cache.get(raw_frame.index, cache_key)
+                if processed is None:
+                    processed = process_frame(raw_frame, settings)
+                    self._cache.put(raw_frame.index, cache_key, processed)
+                return processed
+
+            # Frames are processed concurrently but handed to the writer in order
+            yield from map_ordered(process, self._reader.frames())
+
         def frame_generator() -> Iterator[ProcessedFrame]:
-            for raw_frame in self._reader.frames():
+            # Throttle status updates to ~10 Hz so the UI thread isn't woken
+            # for every frame; the last frame is always reported
+            last_update = 0.0
+            for processed in processed_frames():
                 if worker.is_cancelled:
                     return
-                processed = process_frame(raw_frame, settings)
-                self.call_from_thread(
-                    self._update_status,
-                    f"Saving frame {raw_frame.index + 1}/{info.frame_count}...",
-                )
+                now = time.monotonic()
+                is_last = processed.index + 1 >= info.frame_count
+                if is_last or now - last_update >= STATUS_UPDATE_INTERVAL:
+                    self.call_from_thread(
+                        self._update_status,
+                        f"Saving frame {processed.index + 1}/{info.frame_count}...",
+                    )
+                    last_update = now
                 yield processed
 
         try:
-            save_output(frame_generator(), out, fps=info.fps)
+            # Decode and processing run on their own thread, handing frames
+            # to the encoder through a bounded queue
+            save_output(prefetch(frame_generator()), out, fps=info.fps)
             if not worker.is_cancelled:
                 self.call_from_thread(
                     self._update_status, f"Saved to {out}"
@@ -375,13 +475,11 @@ class AsciiMakerApp(App):
 
     def action_copy(self) -> None:
         """Copy the current frame's ASCII art to the system clipboard."""
-        preview = self.query_one(AsciiPreview)
-        frame = preview.current_frame
+        frame = self._preview.current_frame
         if frame is None:
             self._update_status("No frame to copy")
             return
 
-        text = "\n".join(frame.lines)
         try:
             system = platform.system()
             if system == "Darwin":
@@ -395,8 +493,13 @@ class AsciiMakerApp(App):
             else:
                 self._update_status("Clipboard not supported on this platform")
                 return
-            proc.communicate(text.encode("utf-8"))
-            if proc.returncode == 0:
+            # Stream lines straight to the pipe rather than joining the frame
+            with proc.stdin as stdin:
+                for i, line in enumerate(frame.lines):
+                    if i:
+                        stdin.write(b"\n")
+                    stdin.write(line.encode("utf-8"))
+            if proc.wait() == 0:
                 self._update_status(f"Copied frame {frame.index + 1} to clipboard")
             else:
                 self._update_status("Failed to copy to clipboard")
@@ -414,9 +517,8 @@ class AsciiMakerApp(App):
             self._load_file(path)
 
     def action_toggle_panel(self) -> None:
-        panel = self.query_one("#control-panel", ControlPanel)
         self._panel_visible = not self._panel_visible
-        panel.display = self._panel_visible
+        self._panel.display = self._panel_visible
 
     # --- Message handlers ---
 
@@ -424,7 +526,6 @@ class AsciiMakerApp(App):
         self, event: ControlPanel.SettingsChanged
     ) -> None:
         self._settings = event.settings
-        self._cache.clear()
         if self._reader and not self._playing:
             self._render_current_frame()
 
@@ -433,7 +534,7 @@ class AsciiMakerApp(App):
             return
         self._playing = False
         self._current_frame_idx = event.frame_index
-        self._render_current_frame()
+        self._request_render()
 
     def on_timeline_play_pause(self, event: Timeline.PlayPause) -> None:
         self.action_play_pause()
@@ -449,14 +550,14 @@ class AsciiMakerApp(App):
             return
         self._playing = False
         self._current_frame_idx = 0
-        self._render_current_frame()
+        self._request_render()
 
     def on_timeline_seek_end(self, event: Timeline.SeekEnd) -> None:
         if self._reader is None:
             return
         self._playing = False
-        self._current_frame_idx = self._reader.info.frame_count - 1
-        self._render_current_frame()
+        self._current_frame_idx = self._frame_count - 1
+        self._request_render()
 
 
 class OpenFileScreen(ModalScreen[str | None]):
@@ -12,6 +12,7 @@ from pathlib import Path
 
 from ascii_maker.core.charsets import CharsetName
 from ascii_maker.core.color import ColorMode
+from ascii_maker.core.dither import DitherMethod
 
 
 def _build_parser() -> argparse.ArgumentParser:
@@ -46,7 +47,13 @@ def _build_parser() -> argparse.ArgumentParser:
     convert.add_argument(
         "--dither",
         action="store_true",
-        help="Enable Floyd-Steinberg dithering.",
+        help="Enable dithering.",
+    )
+    convert.add_argument(
+        "--dither-method",
+        choices=[m.value for m in DitherMethod],
+        default="floyd-steinberg",
+        help="Dithering algorithm used with --dither (default: floyd-steinberg).",
     )
     convert.add_argument(
         "--brightness",
@@ -122,6 +129,7 @@ def _run_convert(args: argparse.Namespace) -> None:
     from ascii_maker.core.processor import Settings, process_frame
     from ascii_maker.core.reader import is_url, open_media
     from ascii_maker.core.writer import save_output
+    from ascii_maker.utils.parallel import map_ordered, prefetch
 
     raw_input = args.input
     is_json = args.json
@@ -132,23 +140,22 @@ def _run_convert(args: argparse.Namespace) -> None:
             print(f"Downloading {raw_input}...", file=sys.stderr)
         input_display = raw_input
     else:
-        input_path = Path(raw_input).resolve()
-        input_display = str(input_path)
-        if not input_path.exists():
-            if is_json:
-                _json_error(f"File not found: {input_path}", "FILE_NOT_FOUND")
-            else:
-                print(f"Error: File not found: {input_path}", file=sys.stderr)
-                sys.exit(1)
+        input_display = str(Path(raw_input).resolve())
 
+    # Missing local files surface as FileNotFoundError from open_media,
+    # which saves a separate existence check
     try:
         reader = open_media(raw_input)
-    except (ValueError, IOError, FileNotFoundError) as e:
-        code = "DOWNLOAD_FAILED" if is_remote else "INVALID_INPUT"
+    except (ValueError, IOError) as e:
+        if isinstance(e, FileNotFoundError) and not is_remote:
+            message, code = f"File not found: {input_display}", "FILE_NOT_FOUND"
+        else:
+            message = str(e)
+            code = "DOWNLOAD_FAILED" if is_remote else "INVALID_INPUT"
         if is_json:
-            _json_error(str(e), code)
+            _json_error(message, code)
         else:
-            print(f"Error: {e}", file=sys.stderr)
+            print(f"Error: {message}", file=sys.stderr)
             sys.exit(1)
 
     info = reader.info
@@ -164,6 +171,7 @@ def _run_convert(args: argparse.Namespace) -> None:
         charset=CharsetName(args.charset),
         color_mode=ColorMode(args.color),
         dither=args.dither,
+        dither_method=DitherMethod(args.dither_method),
         brightness=args.brightness,
         contrast=args.contrast,
         invert=args.invert,
@@ -175,8 +183,12 @@ def _run_convert(args: argparse.Namespace) -> None:
 
     def processed_frames():
         nonlocal frame_count
-        for raw_frame in reader.frames():
-            yield process_frame(raw_frame, settings)
+        # Frames are processed on a thread pool, in order, while the writer
+        # renders and encodes earlier ones on its own thread
+        for processed in map_ordered(
+            lambda raw_frame: process_frame(raw_frame, settings), reader.frames()
+        ):
+            yield processed
             frame_count += 1
             if not is_json:
                 print(
@@ -187,7 +199,7 @@ def _run_convert(args: argparse.Namespace) -> None:
 
     try:
         save_output(
-            processed_frames(),
+            prefetch(processed_frames()),
             output_path,
             fps=info.fps,
             font_size=args.font_size,
@@ -213,6 +225,7 @@ def _run_convert(args: argparse.Namespace) -> None:
                 "charset": settings.charset.value,
                 "color": settings.color_mode.value,
                 "dither": settings.dither,
+                "dither_method": settings.dither_method.value,
                 "width": settings.width,
                 "height": settings.height,
             },
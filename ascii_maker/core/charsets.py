@@ -6,7 +6,8 @@ Braille uses a separate 2x4 bit-mapping code path.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import threading
+from dataclasses import dataclass, field
 from enum import Enum
 
 import numpy as np
@@ -37,24 +38,80 @@ class Charset:
     name: CharsetName
     chars: str
     is_braille: bool = False
+    _chars_arr: np.ndarray = field(init=False, repr=False, compare=False)
+    _max_idx: int = field(init=False, repr=False, compare=False)
+    _scale: float = field(init=False, repr=False, compare=False)
+    _index_dtype: type = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # chars never changes, so derive the mapping constants once.
+        # Lookup table for vectorized index → character gathering
+        object.__setattr__(self, "_chars_arr", np.array(list(self.chars), dtype="<U1"))
+        object.__setattr__(self, "_max_idx", len(self.chars) - 1)
+        object.__setattr__(self, "_scale", float(len(self.chars) - 1))
+        # Charsets are short, so indices nearly always fit in a byte
+        index_dtype = np.uint8 if len(self.chars) <= 256 else np.intp
+        object.__setattr__(self, "_index_dtype", index_dtype)
 
     def char_for_luminance(self, luminance: float) -> str:
         """Map a luminance value (0.0-1.0) to a character."""
-        idx = int(luminance * (len(self.chars) - 1))
-        idx = max(0, min(idx, len(self.chars) - 1))
+        idx = int(luminance * self._scale)
+        idx = max(0, min(idx, self._max_idx))
         return self.chars[idx]
 
-    def map_array(self, luminance: np.ndarray) -> list[str]:
+    def map_array(
+        self, luminance: np.ndarray, quantized: bool = False
+    ) -> list[str]:
         """Map a 2D luminance array (0.0-1.0) to lines of characters.
 
+        Pass ``quantized=True`` for input already on this charset's levels
+        (dithered with ``levels=len(chars)``). Float error can leave such a
+        level a hair below its index, so it is rounded instead of truncated.
+
         For braille, use braille_from_array() instead.
         """
-        indices = (luminance * (len(self.chars) - 1)).astype(int)
-        indices = np.clip(indices, 0, len(self.chars) - 1)
-        lines = []
-        for row in indices:
-            lines.append("".join(self.chars[i] for i in row))
-        return lines
+        scaled, indices = _scratch_buffers(luminance.shape, self._index_dtype)
+        np.multiply(luminance, self._scale, out=scaled)
+        if quantized:
+            np.rint(scaled, out=scaled)
+        # Clamp before the narrowing cast so it can't wrap; the unsafe cast
+        # then truncates toward zero like astype(int)
+        np.clip(scaled, 0, self._max_idx, out=scaled)
+        np.copyto(indices, scaled, casting="unsafe")
+        return _rows_to_strings(self._chars_arr[indices])
+
+
+# Per-thread work arrays for map_array (preview, playback and save run
+# on separate worker threads)
+_scratch = threading.local()
+
+
+def _scratch_buffers(
+    shape: tuple[int, ...], index_dtype: type
+) -> tuple[np.ndarray, np.ndarray]:
+    """Return (float32, index) work arrays of the given shape for this thread.
+
+    The arrays are reused across calls while the shape and index dtype stay
+    the same, which they do for every frame at fixed output settings.
+    """
+    bufs = getattr(_scratch, "bufs", None)
+    if bufs is None or bufs[0].shape != shape or bufs[1].dtype != index_dtype:
+        bufs = (np.empty(shape, dtype=np.float32), np.empty(shape, dtype=index_dtype))
+        _scratch.bufs = bufs
+    return bufs
+
+
+def _rows_to_strings(chars: np.ndarray) -> list[str]:
+    """Convert a 2D ``<U1`` character array to one string per row.
+
+    NumPy stores each ``<U1`` as a 4-byte UCS-4 code point, so a contiguous
+    (H, W) array has the same memory layout as an (H,) ``<UW`` array and
+    each row is reinterpreted instead of joined.
+    """
+    h, w = chars.shape
+    if w == 0:
+        return [""] * h
+    return np.ascontiguousarray(chars).view(f"<U{w}").reshape(h).tolist()
 
 
 CHARSETS: dict[CharsetName, Charset] = {
@@ -84,6 +141,13 @@ BRAILLE_DOT_BITS: list[list[int]] = [
     [6, 7],  # row 3
 ]
 
+# Every possible braille character, indexed by its 8-bit dot pattern
+_BRAILLE_TABLE: tuple[str, ...] = tuple(chr(BRAILLE_BASE + i) for i in range(256))
+_BRAILLE_U1 = np.array(_BRAILLE_TABLE, dtype="<U1")
+
+# Same mapping flattened row-major, for shifting whole (..., 4, 2) blocks at once
+BRAILLE_DOT_SHIFTS = np.array(BRAILLE_DOT_BITS, dtype=np.uint32).reshape(8)
+
 
 def braille_char(dots: np.ndarray) -> str:
     """Convert a 4x2 boolean array to a single braille character.
@@ -91,12 +155,8 @@ def braille_char(dots: np.ndarray) -> str:
     Args:
         dots: shape (4, 2) boolean array where True = raised dot.
     """
-    code = 0
-    for row in range(4):
-        for col in range(2):
-            if dots[row, col]:
-                code |= 1 << BRAILLE_DOT_BITS[row][col]
-    return chr(BRAILLE_BASE + code)
+    bits = (np.asarray(dots).reshape(8) > 0).astype(np.uint32)
+    return _BRAILLE_TABLE[int((bits << BRAILLE_DOT_SHIFTS).sum())]
 
 
 def braille_from_array(binary: np.ndarray) -> list[str]:
@@ -112,18 +172,22 @@ def braille_from_array(binary: np.ndarray) -> list[str]:
         List of strings, one per braille row (height // 4 lines).
     """
     h, w = binary.shape
-    # Pad to multiples of 4 (height) and 2 (width) if needed
-    pad_h = (4 - h % 4) % 4
-    pad_w = (2 - w % 2) % 2
-    if pad_h or pad_w:
+    # Pad to multiples of 4 (height) and 2 (width) if needed. The processor
+    # always resizes to whole cells, so this copy is skipped on the hot path.
+    if h % 4 or w % 2:
+        pad_h = (4 - h % 4) % 4
+        pad_w = (2 - w % 2) % 2
         binary = np.pad(binary, ((0, pad_h), (0, pad_w)), constant_values=0)
         h, w = binary.shape
 
-    lines = []
-    for y in range(0, h, 4):
-        line_chars = []
-        for x in range(0, w, 2):
-            block = binary[y : y + 4, x : x + 2]
-            line_chars.append(braille_char(block))
-        lines.append("".join(line_chars))
-    return lines
+    # (H, W) → (rows, cols, 8) with each cell's dots in row-major order
+    blocks = (
+        (binary > 0)
+        .astype(np.uint32)
+        .reshape(h // 4, 4, w // 2, 2)
+        .transpose(0, 2, 1, 3)
+        .reshape(h // 4, w // 2, 8)
+    )
+    # Dot bits are disjoint, so summing the shifted bits is a bitwise OR
+    codes = (blocks << BRAILLE_DOT_SHIFTS).sum(axis=2, dtype=np.uint32)
+    return _rows_to_strings(_BRAILLE_U1[codes])
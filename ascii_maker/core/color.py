@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 from enum import Enum
 
 import numpy as np
@@ -34,6 +35,73 @@ def rgb_to_ansi256(r: int, g: int, b: int) -> int:
     return 16 + 36 * ri + 6 * gi + bi
 
 
+def rgb_array_to_ansi256(colors: np.ndarray) -> np.ndarray:
+    """Vectorized rgb_to_ansi256 over an (..., 3) uint8 RGB array.
+
+    Returns a uint8 array of ANSI 256-color indices with the colors' leading
+    shape, matching rgb_to_ansi256 exactly for every input.
+    """
+    rgb = colors.astype(np.uint32)
+    packed = (rgb[..., 0] << 16) | (rgb[..., 1] << 8) | rgb[..., 2]
+    return _ansi256_lut()[packed]
+
+
+@functools.lru_cache(maxsize=1)
+def _ansi256_lut() -> np.ndarray:
+    """rgb_to_ansi256 for every 24-bit color, flat and indexed by packed RGB.
+
+    16 MiB, so it is built on first use (about 0.1 s), one red plane at a
+    time from per-channel tables of the same arithmetic.
+    """
+    levels = np.arange(256)
+    # Cube coordinate per channel value
+    cube_level = np.round(levels / 255 * 5).astype(np.uint8)
+    # Grayscale ramp index per channel sum
+    gray = np.arange(3 * 255 + 1) // 3
+    ramp = np.where(
+        gray < 8, 16, np.where(gray > 248, 231, 232 + np.round((gray - 8) / 247 * 23))
+    ).astype(np.uint8)
+    # Whether two channel values are within the grayscale tolerance
+    near = np.abs(levels[:, None] - levels[None, :]) < 10
+
+    gb_cube = 16 + 6 * cube_level[:, None] + cube_level[None, :]
+    gb_sum = levels[:, None] + levels[None, :]
+    lut = np.empty((256, 256, 256), dtype=np.uint8)
+    for r in range(256):
+        is_gray = near[r][:, None] & near
+        lut[r] = np.where(is_gray, ramp[r + gb_sum], 36 * cube_level[r] + gb_cube)
+    lut = lut.reshape(-1)
+    lut.flags.writeable = False
+    return lut
+
+
+def ansi256_to_rgb(idx: int) -> tuple[int, int, int]:
+    """Convert ANSI 256-color index to approximate RGB."""
+    if idx < 16:
+        # Standard colors (approximate)
+        basic = [
+            (0, 0, 0), (128, 0, 0), (0, 128, 0), (128, 128, 0),
+            (0, 0, 128), (128, 0, 128), (0, 128, 128), (192, 192, 192),
+            (128, 128, 128), (255, 0, 0), (0, 255, 0), (255, 255, 0),
+            (0, 0, 255), (255, 0, 255), (0, 255, 255), (255, 255, 255),
+        ]
+        return basic[idx]
+    if idx < 232:
+        # 6x6x6 color cube
+        idx -= 16
+        b = (idx % 6) * 51
+        g = ((idx // 6) % 6) * 51
+        r = (idx // 36) * 51
+        return (r, g, b)
+    # Grayscale ramp
+    gray = (idx - 232) * 10 + 8
+    return (gray, gray, gray)
+
+
+# RGB for every palette index, for mapping index arrays back to colors
+ANSI256_RGB = np.array([ansi256_to_rgb(i) for i in range(256)], dtype=np.uint8)
+
+
 def ansi256_fg(color_idx: int) -> str:
     """Return ANSI escape for 256-color foreground."""
     return f"\033[38;5;{color_idx}m"
@@ -46,6 +114,29 @@ def truecolor_fg(r: int, g: int, b: int) -> str:
 
 RESET = "\033[0m"
 
+# Foreground escape for every palette index
+_ANSI256_ESCAPES: tuple[str, ...] = tuple(ansi256_fg(i) for i in range(256))
+
+# Decimal text of every channel value, with and without the ";" separator,
+# so truecolor escapes are assembled without integer formatting
+_CHANNEL_STR: tuple[str, ...] = tuple(str(i) for i in range(256))
+_CHANNEL_STR_SEP: tuple[str, ...] = tuple(f"{i};" for i in range(256))
+
+# Truecolor escapes by packed 0xRRGGBB key. Colors repeat heavily across
+# frames; the cache is emptied whenever it reaches its size cap.
+_TRUECOLOR_ESCAPES: dict[int, str] = {}
+_TRUECOLOR_ESCAPES_MAX = 65536
+
+
+def _truecolor_escape(key: int) -> str:
+    """Build and cache the truecolor escape for a packed RGB key."""
+    if len(_TRUECOLOR_ESCAPES) >= _TRUECOLOR_ESCAPES_MAX:
+        _TRUECOLOR_ESCAPES.clear()
+    r, g, b = key >> 16, (key >> 8) & 0xFF, key & 0xFF
+    escape = f"\033[38;2;{_CHANNEL_STR_SEP[r]}{_CHANNEL_STR_SEP[g]}{_CHANNEL_STR[b]}m"
+    _TRUECOLOR_ESCAPES[key] = escape
+    return escape
+
 
 def colorize_char(char: str, r: int, g: int, b: int, mode: ColorMode) -> str:
     """Wrap a character with ANSI color escapes."""
@@ -76,21 +167,75 @@ def colorize_line(
     if mode == ColorMode.NONE:
         return chars
 
+    n = len(chars)
+    if n == 0:
+        return chars
+
+    keys = _color_keys(colors[:n], mode)
+    return _colorize_keys(chars, keys.tobytes(), mode)
+
+
+def colorize_lines(
+    lines: list[str],
+    colors: np.ndarray,
+    mode: ColorMode,
+) -> list[str]:
+    """Colorize every line of a frame; same result as colorize_line per row.
+
+    Args:
+        lines: the frame's rows of characters.
+        colors: array of shape (len(lines), width, 3) with RGB values (uint8).
+        mode: color mode to use.
+    """
+    if mode == ColorMode.NONE:
+        return list(lines)
+
+    # Color keys for the whole frame in one vectorized pass, not per row
+    keys = _color_keys(colors, mode)
+    rows = keys.shape[0]
+    return [
+        _colorize_keys(line, keys[row_idx, : len(line)].tobytes(), mode)
+        if line and row_idx < rows
+        else line
+        for row_idx, line in enumerate(lines)
+    ]
+
+
+def _color_keys(colors: np.ndarray, mode: ColorMode) -> np.ndarray:
+    """One integer per color over an (..., 3) array; equal keys, equal escapes."""
+    if mode == ColorMode.TRUECOLOR:
+        rgb = colors.astype(np.uint32)
+        return (rgb[..., 0] << 16) | (rgb[..., 1] << 8) | rgb[..., 2]
+    return rgb_array_to_ansi256(colors)
+
+
+@functools.lru_cache(maxsize=1024)
+def _colorize_keys(chars: str, key_bytes: bytes, mode: ColorMode) -> str:
+    """Build the escaped line for per-character color keys.
+
+    Keyed on the quantized colors, so rows that repeat across frames (static
+    backgrounds, or near-identical rows in 256-color mode) are built once.
+    """
+    if mode == ColorMode.TRUECOLOR:
+        keys = np.frombuffer(key_bytes, dtype=np.uint32)
+    else:
+        keys = np.frombuffer(key_bytes, dtype=np.uint8)
+
+    # Emit one escape per run of identically colored characters
+    starts = np.flatnonzero(np.concatenate(([True], keys[1:] != keys[:-1])))
+    ends = np.append(starts[1:], len(chars))
+    runs = zip(starts.tolist(), ends.tolist(), keys[starts].tolist())
+
     parts: list[str] = []
-    prev_escape = ""
-    for i, ch in enumerate(chars):
-        r, g, b = int(colors[i, 0]), int(colors[i, 1]), int(colors[i, 2])
-        if mode == ColorMode.TRUECOLOR:
-            esc = truecolor_fg(r, g, b)
-        else:
-            esc = ansi256_fg(rgb_to_ansi256(r, g, b))
-
-        # Avoid repeating the same escape code
-        if esc != prev_escape:
-            parts.append(esc)
-            prev_escape = esc
-        parts.append(ch)
-
-    if prev_escape:
-        parts.append(RESET)
+    if mode == ColorMode.TRUECOLOR:
+        cached = _TRUECOLOR_ESCAPES.get
+        for start, end, key in runs:
+            parts.append(cached(key) or _truecolor_escape(key))
+            parts.append(chars[start:end])
+    else:
+        for start, end, key in runs:
+            parts.append(_ANSI256_ESCAPES[key])
+            parts.append(chars[start:end])
+
+    parts.append(RESET)
     return "".join(parts)
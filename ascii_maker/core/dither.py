@@ -1,25 +1,21 @@
-"""Floyd-Steinberg error diffusion dithering."""
+"""Floyd-Steinberg error diffusion and Bayer ordered dithering."""
 
 from __future__ import annotations
 
+import functools
+from enum import Enum
+
 import numpy as np
 
 
-def floyd_steinberg(gray: np.ndarray, levels: int = 2) -> np.ndarray:
-    """Apply Floyd-Steinberg dithering to a grayscale image.
+class DitherMethod(str, Enum):
+    FLOYD_STEINBERG = "floyd-steinberg"
+    BAYER = "bayer"
 
-    Args:
-        gray: 2D float array with values in [0.0, 1.0].
-        levels: number of output levels. 2 = binary (black/white),
-                higher values give more gray levels matching charset length.
 
-    Returns:
-        Dithered 2D float array with values quantized to `levels` steps.
-    """
-    img = gray.astype(np.float64).copy()
+def _diffuse_errors(img: np.ndarray, step: float) -> None:
+    """Quantize ``img`` in place, pushing each pixel's error onto its neighbours."""
     h, w = img.shape
-    step = 1.0 / (levels - 1) if levels > 1 else 1.0
-
     for y in range(h):
         for x in range(w):
             old = img[y, x]
@@ -37,16 +33,89 @@ def floyd_steinberg(gray: np.ndarray, levels: int = 2) -> np.ndarray:
                 if x + 1 < w:
                     img[y + 1, x + 1] += err * 1 / 16
 
+
+# Numba is optional (pip install ascii-maker[fast]). When present the same
+# loop is compiled to native code; nogil lets save workers dither in parallel.
+try:
+    from numba import njit
+except ImportError:
+    _diffuse_errors_fast = _diffuse_errors
+else:
+    _diffuse_errors_fast = njit(cache=True, nogil=True)(_diffuse_errors)
+
+
+def floyd_steinberg(gray: np.ndarray, levels: int = 2) -> np.ndarray:
+    """Apply Floyd-Steinberg dithering to a grayscale image.
+
+    Args:
+        gray: 2D float array with values in [0.0, 1.0]. float32 input is
+              dithered in float32, anything else in float64.
+        levels: number of output levels. 2 = binary (black/white),
+                higher values give more gray levels matching charset length.
+
+    Returns:
+        Dithered 2D float array with values quantized to `levels` steps.
+    """
+    # Work in the input's float precision (float32 from the processor)
+    img = np.array(gray, dtype=np.result_type(gray.dtype, np.float32))
+    step = 1.0 / (levels - 1) if levels > 1 else 1.0
+    _diffuse_errors_fast(img, step)
     return np.clip(img, 0.0, 1.0)
 
 
 def floyd_steinberg_fast(gray: np.ndarray, levels: int = 2) -> np.ndarray:
-    """Vectorized Floyd-Steinberg approximation for larger images.
+    """Alias of floyd_steinberg, kept for existing callers.
 
-    Uses row-by-row processing with vectorized error distribution within rows
-    where possible, falling back to per-pixel for inter-pixel error propagation.
-    At terminal resolution (~200x60) the pure Python version is fast enough,
-    so this is here as an optimization option for larger inputs.
+    floyd_steinberg itself runs the Numba-compiled kernel when Numba is
+    installed and the interpreted loop otherwise.
     """
-    # At terminal resolution the pure version is <5ms; just delegate
     return floyd_steinberg(gray, levels)
+
+
+def _bayer_matrix(order: int) -> np.ndarray:
+    """The 2**order x 2**order Bayer index matrix (values 0 .. 4**order - 1)."""
+    m = np.zeros((1, 1), dtype=np.int64)
+    for _ in range(order):
+        m = np.block([[4 * m, 4 * m + 2], [4 * m + 3, 4 * m + 1]])
+    return m
+
+
+# Canonical 8x8 Bayer matrix
+BAYER8 = _bayer_matrix(3).astype(np.uint8)
+
+
+@functools.lru_cache(maxsize=8)
+def _bayer_thresholds(height: int, width: int) -> np.ndarray:
+    """Per-pixel float32 thresholds in (0, 1) for a ``height`` x ``width`` frame.
+
+    Frames of one output share their size, so the tiled matrix is built once.
+    """
+    tile = (BAYER8.astype(np.float32) + 0.5) / 64
+    reps = (-(-height // 8), -(-width // 8))
+    thresholds = np.tile(tile, reps)[:height, :width]
+    thresholds.flags.writeable = False
+    return thresholds
+
+
+def ordered_dither(gray: np.ndarray, levels: int = 2) -> np.ndarray:
+    """Apply 8x8 Bayer ordered dithering to a grayscale image.
+
+    Each pixel is quantized against a fixed threshold from the tiled Bayer
+    matrix, with no error carried between pixels, so the whole frame is a
+    few vectorized NumPy operations. The pattern is more regular than
+    Floyd-Steinberg's, but it does not shimmer between animation frames.
+
+    Args:
+        gray: 2D float array with values in [0.0, 1.0].
+        levels: number of output levels, as for floyd_steinberg.
+
+    Returns:
+        Dithered 2D float array with values quantized to `levels` steps.
+    """
+    gray = np.asarray(gray)
+    steps = max(levels - 1, 1)
+    thresholds = _bayer_thresholds(*gray.shape)
+    dtype = np.result_type(gray.dtype, np.float32)
+    result = np.floor(gray * dtype.type(steps) + thresholds)
+    result *= dtype.type(1 / steps)
+    return np.clip(result, 0.0, 1.0, out=result)
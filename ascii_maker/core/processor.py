@@ -5,9 +5,10 @@ Resize → grayscale → brightness/contrast → dither/char-map → colorize.
 
 from __future__ import annotations
 
-import hashlib
+import functools
 from dataclasses import dataclass, field
 
+import cv2
 import numpy as np
 from PIL import Image
 
@@ -16,12 +17,12 @@ from ascii_maker.core.charsets import (
     CharsetName,
     braille_from_array,
 )
-from ascii_maker.core.color import ColorMode, colorize_line
-from ascii_maker.core.dither import floyd_steinberg
+from ascii_maker.core.color import ColorMode, colorize_lines
+from ascii_maker.core.dither import DitherMethod, floyd_steinberg, ordered_dither
 from ascii_maker.core.reader import Frame
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Settings:
     """Processing settings that affect output."""
 
@@ -33,47 +34,91 @@ class Settings:
     invert: bool = False
     width: int = 80
     height: int = 24
+    dither_method: DitherMethod = DitherMethod.FLOYD_STEINBERG
+    _hash: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Settings are immutable, so the cache key is computed exactly once.
+        # Keys only live in this process's frame cache, so the builtin tuple
+        # hash serves; it is not stable across interpreter runs.
+        key = hash(
+            (
+                self.charset, self.color_mode, self.dither, self.brightness,
+                self.contrast, self.invert, self.width, self.height,
+                self.dither_method,
+            )
+        )
+        object.__setattr__(self, "_hash", f"{key & 0xFFFFFFFFFFFFFFFF:016x}")
 
     def hash(self) -> str:
-        """Deterministic hash for cache keying."""
-        data = (
-            f"{self.charset}:{self.color_mode}:{self.dither}:"
-            f"{self.brightness}:{self.contrast}:{self.invert}:"
-            f"{self.width}:{self.height}"
-        )
-        return hashlib.md5(data.encode()).hexdigest()[:12]
+        """Hash for cache keying, stable only within this process."""
+        return self._hash
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessedFrame:
-    """Result of processing a single frame."""
+    """Result of processing a single frame.
+
+    Characters and colors are kept as separate arrays; the ANSI-escaped
+    terminal lines are only built when ``colored_lines`` is first read.
+    """
 
     lines: list[str]  # Plain text lines (no color)
-    colored_lines: list[str]  # Lines with ANSI color escapes
     duration_ms: int
     index: int
     width: int = 0
     height: int = 0
+    # RGB sample per character, shape (rows, cols, 3); None when uncolored
+    colors: np.ndarray | None = None
+    color_mode: ColorMode = ColorMode.NONE
+    _colored_lines: list[str] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
+    @property
+    def colored_lines(self) -> list[str]:
+        """Lines with ANSI color escapes, built on first access."""
+        return self.build_colored_lines()
 
-def _resize_frame(img: Image.Image, width: int, height: int) -> Image.Image:
-    """Resize image to target character grid dimensions.
+    def build_colored_lines(self) -> list[str]:
+        """Build the colored lines if not built yet, and return them."""
+        if self._colored_lines is None:
+            if self.colors is None:
+                self._colored_lines = list(self.lines)
+            else:
+                self._colored_lines = colorize_lines(
+                    self.lines, self.colors, self.color_mode
+                )
+        return self._colored_lines
 
-    Characters are roughly 1:2 aspect ratio (tall), so we compensate.
-    """
-    return img.resize((width, height), Image.Resampling.LANCZOS)
+
+def _to_rgb_array(img: Image.Image | np.ndarray) -> np.ndarray:
+    """View an image as an (H, W, 3) uint8 RGB array."""
+    if isinstance(img, np.ndarray):
+        return img
+    if img.mode != "RGB":
+        img = img.convert("RGB")
+    return np.asarray(img)
 
 
-def _resize_for_braille(img: Image.Image, width: int, height: int) -> Image.Image:
-    """Resize for braille: each braille char covers a 2x4 pixel grid."""
-    pixel_w = width * 2
-    pixel_h = height * 4
-    return img.resize((pixel_w, pixel_h), Image.Resampling.LANCZOS)
+def _resize_rgb_fast(rgb: np.ndarray, width: int, height: int) -> np.ndarray:
+    """Resize an RGB array to ``width`` x ``height`` pixels with OpenCV.
+
+    Frames are almost always shrunk to the character grid, where area
+    averaging is both faster and at least as clean as Lanczos; the rare
+    enlargement keeps Lanczos.
+    """
+    src_h, src_w = rgb.shape[:2]
+    if width <= src_w and height <= src_h:
+        interpolation = cv2.INTER_AREA
+    else:
+        interpolation = cv2.INTER_LANCZOS4
+    return cv2.resize(rgb, (width, height), interpolation=interpolation)
 
 
-def _to_grayscale(img: Image.Image) -> np.ndarray:
-    """Convert to grayscale float array in [0.0, 1.0]."""
-    return np.array(img.convert("L"), dtype=np.float64) / 255.0
+def _to_luma(rgb: np.ndarray) -> np.ndarray:
+    """Convert an RGB array to an 8-bit grayscale (luma) array."""
+    return cv2.cvtColor(rgb, cv2.COLOR_RGB2GRAY)
 
 
 def _adjust_brightness_contrast(
@@ -98,37 +143,45 @@ def _adjust_brightness_contrast(
     return np.clip(result, 0.0, 1.0)
 
 
-def _get_color_samples(
-    img: Image.Image, width: int, height: int
-) -> np.ndarray:
-    """Get per-character RGB color by sampling center pixel of each cell.
+@functools.lru_cache(maxsize=32)
+def _tone_curve(brightness: int, contrast: int, invert: bool) -> np.ndarray:
+    """Map each 8-bit luma level to its final float32 luminance in [0.0, 1.0].
 
-    Returns array of shape (height, width, 3).
+    Scaling to [0, 1], brightness, contrast, clipping and invert depend only
+    on the luma value, so indexing this 256-entry table applies all of them
+    in one pass over the frame with a single output buffer. float32 is ample
+    for 8-bit input and halves the traffic of dithering and char mapping.
     """
-    resized = img.resize((width, height), Image.Resampling.LANCZOS)
-    return np.array(resized.convert("RGB"), dtype=np.uint8)
+    levels = np.arange(256, dtype=np.float32) * np.float32(1 / 255)
+    curve = _adjust_brightness_contrast(levels, brightness, contrast)
+    if invert:
+        curve = 1.0 - curve
+    curve.flags.writeable = False
+    return curve
 
 
 def _get_braille_color_samples(
-    img: Image.Image, width: int, height: int
+    rgb: np.ndarray, width: int, height: int
 ) -> np.ndarray:
     """Get per-braille-character RGB color by averaging each 2x4 block.
 
+    Args:
+        rgb: the braille-resolution frame, shape (height * 4, width * 2, 3).
+
     Returns array of shape (height, width, 3).
     """
-    pixel_w = width * 2
-    pixel_h = height * 4
-    resized = np.array(
-        img.resize((pixel_w, pixel_h), Image.Resampling.LANCZOS).convert("RGB"),
-        dtype=np.float64,
-    )
-
-    colors = np.zeros((height, width, 3), dtype=np.uint8)
-    for y in range(height):
-        for x in range(width):
-            block = resized[y * 4 : (y + 1) * 4, x * 2 : (x + 1) * 2, :]
-            colors[y, x] = block.mean(axis=(0, 1)).astype(np.uint8)
-    return colors
+    # Split rows into groups of 4 and columns into pairs, then average each
+    # cell. Summing the four rows one slice at a time in uint16 is exact (at
+    # most 8 * 255) and far faster than a multi-axis float mean; the shift
+    # floors like the float cast did.
+    blocks = rgb.reshape(height, 4, width, 2, 3)
+    sums = blocks[:, 0].astype(np.uint16)
+    sums += blocks[:, 1]
+    sums += blocks[:, 2]
+    sums += blocks[:, 3]
+    cells = sums[:, :, 0] + sums[:, :, 1]
+    cells >>= 3
+    return cells.astype(np.uint8)
 
 
 def process_frame(frame: Frame, settings: Settings) -> ProcessedFrame:
@@ -137,62 +190,54 @@ def process_frame(frame: Frame, settings: Settings) -> ProcessedFrame:
     is_braille = charset.is_braille
     w, h = settings.width, settings.height
 
-    # Resize
+    # Resize; each braille char covers a 2x4 pixel grid
     if is_braille:
-        resized = _resize_for_braille(frame.image, w, h)
+        pixel_w, pixel_h = w * 2, h * 4
     else:
-        resized = _resize_frame(frame.image, w, h)
-
-    # Grayscale
-    gray = _to_grayscale(resized)
+        pixel_w, pixel_h = w, h
+    rgb = _resize_rgb_fast(_to_rgb_array(frame.image), pixel_w, pixel_h)
 
-    # Brightness / contrast
-    gray = _adjust_brightness_contrast(gray, settings.brightness, settings.contrast)
+    # Grayscale, brightness / contrast and invert in one table lookup
+    # The resized RGB pixels feed both the grayscale and the color paths
+    curve = _tone_curve(settings.brightness, settings.contrast, settings.invert)
+    gray = curve[_to_luma(rgb)]
 
-    # Invert
-    if settings.invert:
-        gray = 1.0 - gray
+    dither = floyd_steinberg
+    if settings.dither_method == DitherMethod.BAYER:
+        dither = ordered_dither
 
     # Dither or direct mapping
     if is_braille:
         # Braille: threshold to binary, optionally with dithering
         if settings.dither:
-            gray = floyd_steinberg(gray, levels=2)
-        else:
-            gray = (gray > 0.5).astype(np.float64)
+            gray = dither(gray, levels=2)
         binary = (gray > 0.5).astype(np.uint8)
         plain_lines = braille_from_array(binary)
     else:
         if settings.dither:
-            gray = floyd_steinberg(gray, levels=len(charset.chars))
-        plain_lines = charset.map_array(gray)
+            gray = dither(gray, levels=len(charset.chars))
+        plain_lines = charset.map_array(gray, quantized=settings.dither)
 
     # Color
     if settings.color_mode != ColorMode.NONE:
         if is_braille:
-            color_samples = _get_braille_color_samples(frame.image, w, h)
+            colors = _get_braille_color_samples(rgb, w, h)
         else:
-            color_samples = _get_color_samples(frame.image, w, h)
+            # Already one pixel per character cell
+            colors = rgb
 
         # Apply invert to color samples too if inverted
         if settings.invert:
-            color_samples = 255 - color_samples
-
-        colored = []
-        for row_idx, line in enumerate(plain_lines):
-            if row_idx < color_samples.shape[0]:
-                row_colors = color_samples[row_idx, : len(line), :]
-                colored.append(colorize_line(line, row_colors, settings.color_mode))
-            else:
-                colored.append(line)
+            colors = 255 - colors
     else:
-        colored = list(plain_lines)
+        colors = None
 
     return ProcessedFrame(
         lines=plain_lines,
-        colored_lines=colored,
         duration_ms=frame.duration_ms,
         index=frame.index,
         width=w,
         height=h,
+        colors=colors,
+        color_mode=settings.color_mode,
     )
@@ -6,9 +6,12 @@ GIF frames are composited onto a canvas to handle disposal methods correctly.
 
 from __future__ import annotations
 
+import shutil
 import tempfile
+import threading
 import urllib.request
 import urllib.error
+from collections import OrderedDict
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Iterator
@@ -19,16 +22,16 @@ import numpy as np
 from PIL import Image
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Frame:
     """A single video/animation frame."""
 
-    image: Image.Image  # RGB PIL image
+    image: Image.Image | np.ndarray  # RGB PIL image, or (H, W, 3) uint8 RGB array
     duration_ms: int  # Display duration in milliseconds
     index: int
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class MediaInfo:
     """Metadata about the input file."""
 
@@ -40,14 +43,28 @@ class MediaInfo:
     height: int
 
 
+# Media format read from each supported file extension
+_SUFFIX_FORMATS: dict[str, str] = {
+    ".gif": "gif",
+    ".mp4": "mp4",
+    ".avi": "mp4",
+    ".mov": "mp4",
+    ".mkv": "mp4",
+    ".webm": "mp4",
+}
+
+
 def detect_format(path: Path) -> str:
     """Detect media format from file extension."""
     suffix = path.suffix.lower()
-    if suffix == ".gif":
-        return "gif"
-    if suffix in (".mp4", ".avi", ".mov", ".mkv", ".webm"):
-        return "mp4"
-    raise ValueError(f"Unsupported format: {suffix}")
+    fmt = _SUFFIX_FORMATS.get(suffix)
+    if fmt is None:
+        raise ValueError(f"Unsupported format: {suffix}")
+    return fmt
+
+
+# Decoded frames GifReader.seek() keeps for revisits
+SEEK_CACHE_SIZE = 8
 
 
 class GifReader:
@@ -57,7 +74,11 @@ class GifReader:
         self.path = path
         self._img = Image.open(path)
         self._frame_count = getattr(self._img, "n_frames", 1)
-        self._canvas: Image.Image | None = None
+        # Compositing state of the last seek(), and the frames it returned
+        self._seek_lock = threading.Lock()
+        self._seek_frames: Iterator[tuple[int, Image.Image, int]] | None = None
+        self._seek_next = 0
+        self._recent: OrderedDict[int, Frame] = OrderedDict()
 
     @property
     def info(self) -> MediaInfo:
@@ -72,8 +93,12 @@ class GifReader:
             height=self._img.height,
         )
 
-    def frames(self) -> Iterator[Frame]:
-        """Yield all frames with proper GIF disposal compositing."""
+    def _composited(self) -> Iterator[tuple[int, Image.Image, int]]:
+        """Yield (index, RGBA canvas, duration_ms) for each frame in order.
+
+        The canvas is only valid until the next item is requested, when the
+        frame's disposal method is applied to it.
+        """
         img = Image.open(self.path)
         canvas = Image.new("RGBA", img.size, (0, 0, 0, 255))
 
@@ -88,11 +113,7 @@ class GifReader:
             frame = img.convert("RGBA")
             canvas.paste(frame, (0, 0), frame)
 
-            yield Frame(
-                image=canvas.copy().convert("RGB"),
-                duration_ms=max(duration, 10),  # Clamp absurdly short durations
-                index=i,
-            )
+            yield i, canvas, max(duration, 10)  # Clamp absurdly short durations
 
             # Apply disposal after yielding
             if disposal == 2:
@@ -100,33 +121,57 @@ class GifReader:
             elif disposal == 3 and previous is not None:
                 canvas = previous
 
+    def frames(self) -> Iterator[Frame]:
+        """Yield all frames with proper GIF disposal compositing."""
+        for i, canvas, duration in self._composited():
+            yield Frame(image=canvas.convert("RGB"), duration_ms=duration, index=i)
+
     def seek(self, frame_idx: int) -> Frame:
-        """Get a specific frame by index (composites up to that frame)."""
-        img = Image.open(self.path)
-        canvas = Image.new("RGBA", img.size, (0, 0, 0, 255))
+        """Get a specific frame by index (composites up to that frame).
+
+        Compositing resumes from the last frame reached instead of frame 0
+        when moving forward, as playback does, and the most recently
+        returned frames are kept, so re-rendering one with new settings
+        does not decode it again.
+        """
+        with self._seek_lock:
+            frame = self._recent.get(frame_idx)
+            if frame is not None:
+                self._recent.move_to_end(frame_idx)
+                return frame
+
+            if self._seek_frames is None or frame_idx < self._seek_next:
+                self._seek_frames = self._composited()
+                self._seek_next = 0
+            for i, canvas, duration in self._seek_frames:
+                if i == frame_idx:
+                    break
+            else:
+                self._seek_frames = None
+                raise IndexError(f"Frame {frame_idx} not found")
+            self._seek_next = frame_idx + 1
 
-        for i in range(frame_idx + 1):
-            img.seek(i)
-            disposal = img.info.get("disposal", 0)
+            frame = Frame(
+                image=canvas.convert("RGB"), duration_ms=duration, index=frame_idx
+            )
+            self._recent[frame_idx] = frame
+            if len(self._recent) > SEEK_CACHE_SIZE:
+                self._recent.popitem(last=False)
+            return frame
 
-            previous = canvas.copy() if disposal == 3 else None
+    def close(self) -> None:
+        """Close the GIF file and drop the seek() compositing state."""
+        with self._seek_lock:
+            self._seek_frames = None
+            self._seek_next = 0
+            self._recent.clear()
+        self._img.close()
 
-            frame = img.convert("RGBA")
-            canvas.paste(frame, (0, 0), frame)
+    def __enter__(self) -> GifReader:
+        return self
 
-            # Apply disposal for intermediate frames (not the target)
-            if i < frame_idx:
-                if disposal == 2:
-                    canvas = Image.new("RGBA", img.size, (0, 0, 0, 255))
-                elif disposal == 3 and previous is not None:
-                    canvas = previous
-
-        duration = img.info.get("duration", 100)
-        return Frame(
-            image=canvas.convert("RGB"),
-            duration_ms=max(duration, 10),
-            index=frame_idx,
-        )
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
 
     @property
     def frame_count(self) -> int:
@@ -134,7 +179,11 @@ class GifReader:
 
 
 class Mp4Reader:
-    """Lazy frame iterator for MP4/video files using OpenCV."""
+    """Lazy frame iterator for MP4/video files using OpenCV.
+
+    Frames are yielded as NumPy RGB arrays straight from the decoder, with
+    no round trip through PIL.
+    """
 
     def __init__(self, path: Path) -> None:
         self.path = path
@@ -146,6 +195,10 @@ class Mp4Reader:
         self._width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
         self._height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
         cap.release()
+        # Capture kept open by seek(), and the index its next read() returns
+        self._seek_lock = threading.Lock()
+        self._seek_cap: cv2.VideoCapture | None = None
+        self._seek_next = 0
 
     @property
     def info(self) -> MediaInfo:
@@ -169,24 +222,51 @@ class Mp4Reader:
                 if not ret:
                     break
                 rgb = cv2.cvtColor(bgr, cv2.COLOR_BGR2RGB)
-                pil_img = Image.fromarray(rgb)
-                yield Frame(image=pil_img, duration_ms=duration_ms, index=idx)
+                yield Frame(image=rgb, duration_ms=duration_ms, index=idx)
                 idx += 1
         finally:
             cap.release()
 
     def seek(self, frame_idx: int) -> Frame:
-        """Get a specific frame by index."""
-        cap = cv2.VideoCapture(str(self.path))
-        cap.set(cv2.CAP_PROP_POS_FRAMES, frame_idx)
-        ret, bgr = cap.read()
-        cap.release()
-        if not ret:
-            raise IndexError(f"Frame {frame_idx} not found")
+        """Get a specific frame by index.
+
+        The capture stays open between calls, and asking for the frame after
+        the last one returned, as playback does, is a plain sequential read
+        instead of reopening the file and seeking from a keyframe.
+        """
+        with self._seek_lock:
+            if self._seek_cap is None:
+                self._seek_cap = cv2.VideoCapture(str(self.path))
+                self._seek_next = 0
+            if frame_idx != self._seek_next:
+                self._seek_cap.set(cv2.CAP_PROP_POS_FRAMES, frame_idx)
+            ret, bgr = self._seek_cap.read()
+            if not ret:
+                # Position is unknown after a failed read; seek next time
+                self._seek_next = -1
+                raise IndexError(f"Frame {frame_idx} not found")
+            self._seek_next = frame_idx + 1
         rgb = cv2.cvtColor(bgr, cv2.COLOR_BGR2RGB)
-        pil_img = Image.fromarray(rgb)
         duration_ms = int(1000.0 / self._fps)
-        return Frame(image=pil_img, duration_ms=duration_ms, index=frame_idx)
+        return Frame(image=rgb, duration_ms=duration_ms, index=frame_idx)
+
+    def close(self) -> None:
+        """Release the capture kept open by seek().
+
+        A later seek() opens a new one, so closing is safe while another
+        thread may still seek.
+        """
+        with self._seek_lock:
+            if self._seek_cap is not None:
+                self._seek_cap.release()
+                self._seek_cap = None
+            self._seek_next = 0
+
+    def __enter__(self) -> Mp4Reader:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
 
     @property
     def frame_count(self) -> int:
@@ -207,12 +287,16 @@ def _guess_extension_from_url(url: str) -> str:
     parsed = urlparse(url)
     url_path = parsed.path.split("?")[0]  # Strip query params
     suffix = Path(url_path).suffix.lower()
-    if suffix in (".gif", ".mp4", ".avi", ".mov", ".mkv", ".webm"):
+    if suffix in _SUFFIX_FORMATS:
         return suffix
     # Default to .gif for ambiguous URLs
     return ".gif"
 
 
+# Read size for downloads; large enough that per-chunk overhead is negligible
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+
+
 def download_media(
     url: str,
     on_progress: callable | None = None,
@@ -236,16 +320,19 @@ def download_media(
     try:
         req = urllib.request.Request(url, headers={"User-Agent": "ascii-maker/0.1"})
         with urllib.request.urlopen(req, timeout=30) as resp:
-            total = int(resp.headers.get("Content-Length", 0))
-            downloaded = 0
-            while True:
-                chunk = resp.read(65536)
-                if not chunk:
-                    break
-                tmp.write(chunk)
-                downloaded += len(chunk)
-                if on_progress:
+            if on_progress is None:
+                shutil.copyfileobj(resp, tmp, DOWNLOAD_CHUNK_SIZE)
+            else:
+                total = int(resp.headers.get("Content-Length", 0))
+                downloaded = 0
+                # Read into one preallocated buffer instead of a new bytes per chunk
+                buf = bytearray(DOWNLOAD_CHUNK_SIZE)
+                view = memoryview(buf)
+                while n := resp.readinto(buf):
+                    tmp.write(view[:n])
+                    downloaded += n
                     on_progress(downloaded, total)
+        size = tmp.tell()
         tmp.close()
     except urllib.error.URLError as e:
         tmp.close()
@@ -257,7 +344,7 @@ def download_media(
         raise
 
     # Validate it's a real media file
-    if tmp_path.stat().st_size == 0:
+    if size == 0:
         tmp_path.unlink(missing_ok=True)
         raise ValueError(f"Downloaded file is empty: {url}")
 
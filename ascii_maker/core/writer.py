@@ -6,7 +6,7 @@ or MP4 via OpenCV VideoWriter.
 
 from __future__ import annotations
 
-import re
+import functools
 from pathlib import Path
 from typing import Callable, Iterator
 
@@ -14,18 +14,19 @@ import cv2
 import numpy as np
 from PIL import Image, ImageDraw, ImageFont
 
+from ascii_maker.core.color import ANSI256_RGB, ColorMode, rgb_array_to_ansi256
 from ascii_maker.core.processor import ProcessedFrame
 
 # Monospace font size and metrics
 DEFAULT_FONT_SIZE = 14
 CHAR_WIDTH_RATIO = 0.6  # Approximate char width / font size for monospace
 
-
-def _strip_ansi(text: str) -> str:
-    """Remove ANSI escape sequences from text."""
-    return re.sub(r"\033\[[0-9;]*m", "", text)
+# Approximate size of the per-cell glyph alpha blended at once; frames are
+# composited in bands of rows this large
+BLEND_BAND_BYTES = 256 << 10
 
 
+@functools.lru_cache(maxsize=8)
 def _get_font(size: int = DEFAULT_FONT_SIZE) -> ImageFont.FreeTypeFont | ImageFont.ImageFont:
     """Get a monospace font for rendering."""
     # Try common monospace fonts
@@ -44,69 +45,73 @@ def _get_font(size: int = DEFAULT_FONT_SIZE) -> ImageFont.FreeTypeFont | ImageFo
     return ImageFont.load_default()
 
 
-def _parse_ansi_colors(colored_line: str) -> list[tuple[str, tuple[int, int, int]]]:
-    """Parse ANSI-colored text into (char, rgb) pairs.
+class _GlyphAtlas:
+    """Alpha masks of glyphs pre-rendered once for one font size.
 
-    Handles truecolor (38;2;r;g;b) and 256-color (38;5;N) sequences.
-    Returns list of (character, (r, g, b)) tuples.
+    Each glyph is drawn into a tile the size of a character cell plus a
+    margin of half a cell on every side, so ink that spills past the cell
+    (wide glyphs, descenders) is kept and composited onto the neighbouring
+    cells just as drawing the text would.
     """
-    result: list[tuple[str, tuple[int, int, int]]] = []
-    current_color = (255, 255, 255)
-    i = 0
-    line = colored_line
-
-    while i < len(line):
-        if line[i] == "\033" and i + 1 < len(line) and line[i + 1] == "[":
-            # Parse escape sequence
-            end = line.find("m", i)
-            if end == -1:
-                i += 1
-                continue
-            seq = line[i + 2 : end]
-            parts = seq.split(";")
-
-            if len(parts) >= 5 and parts[0] == "38" and parts[1] == "2":
-                # Truecolor
-                r = int(parts[2]) if parts[2].isdigit() else 255
-                g = int(parts[3]) if parts[3].isdigit() else 255
-                b = int(parts[4]) if parts[4].isdigit() else 255
-                current_color = (r, g, b)
-            elif len(parts) >= 3 and parts[0] == "38" and parts[1] == "5":
-                # 256-color - convert to approximate RGB
-                idx = int(parts[2]) if parts[2].isdigit() else 7
-                current_color = _ansi256_to_rgb(idx)
-            elif parts == ["0"]:
-                current_color = (255, 255, 255)
-
-            i = end + 1
-        else:
-            result.append((line[i], current_color))
-            i += 1
-
-    return result
-
-
-def _ansi256_to_rgb(idx: int) -> tuple[int, int, int]:
-    """Convert ANSI 256-color index to approximate RGB."""
-    if idx < 16:
-        # Standard colors (approximate)
-        basic = [
-            (0, 0, 0), (128, 0, 0), (0, 128, 0), (128, 128, 0),
-            (0, 0, 128), (128, 0, 128), (0, 128, 128), (192, 192, 192),
-            (128, 128, 128), (255, 0, 0), (0, 255, 0), (255, 255, 0),
-            (0, 0, 255), (255, 0, 255), (0, 255, 255), (255, 255, 255),
-        ]
-        return basic[idx]
-    if idx < 232:
-        # 6x6x6 color cube
-        idx -= 16
-        b = (idx % 6) * 51
-        g = ((idx // 6) % 6) * 51
-        r = (idx // 36) * 51
-        return (r, g, b)
-    # Grayscale ramp
-    gray = (idx - 232) * 10 + 8
-    return (gray, gray, gray)
+
+    def __init__(self, size: int) -> None:
+        self.font = _get_font(size)
+        self.char_w = int(size * CHAR_WIDTH_RATIO)
+        self.char_h = size + 2
+        self.pad_x = self.char_w // 2
+        self.pad_y = self.char_h // 2
+        # char -> (mask, ink bounds (left, top, right, bottom) in the tile)
+        self._tiles: dict[str, tuple[np.ndarray, tuple[int, int, int, int]]] = {}
+
+    def _tile(self, char: str) -> tuple[np.ndarray, tuple[int, int, int, int]]:
+        tile = self._tiles.get(char)
+        if tile is None:
+            img = Image.new(
+                "L", (self.char_w + 2 * self.pad_x, self.char_h + 2 * self.pad_y), 0
+            )
+            ImageDraw.Draw(img).text(
+                (self.pad_x, self.pad_y), char, fill=255, font=self.font
+            )
+            mask = np.asarray(img)
+            ys, xs = np.nonzero(mask)
+            if len(xs):
+                bounds = (
+                    int(xs.min()), int(ys.min()), int(xs.max()) + 1, int(ys.max()) + 1
+                )
+            else:
+                bounds = (self.pad_x, self.pad_y, self.pad_x, self.pad_y)
+            tile = self._tiles[char] = (mask, bounds)
+        return tile
+
+    def masks(self, chars: list[str]) -> tuple[np.ndarray, int, int]:
+        """Masks of ``chars`` cropped to their combined ink, and the crop origin.
+
+        Returns (masks of shape (len(chars), h, w), x offset, y offset), where
+        the offsets place the crop relative to the top-left of a glyph's cell.
+        """
+        tiles = [self._tile(char) for char in chars]
+        left = min(self.pad_x, *(b[0] for _, b in tiles))
+        top = min(self.pad_y, *(b[1] for _, b in tiles))
+        right = max(self.pad_x + self.char_w, *(b[2] for _, b in tiles))
+        bottom = max(self.pad_y + self.char_h, *(b[3] for _, b in tiles))
+        masks = np.stack([mask[top:bottom, left:right] for mask, _ in tiles])
+        return masks, left - self.pad_x, top - self.pad_y
+
+
+@functools.lru_cache(maxsize=8)
+def _glyph_atlas(size: int) -> _GlyphAtlas:
+    """Glyph atlas for a font size, shared by every frame rendered at it."""
+    return _GlyphAtlas(size)
+
+
+def _char_grid(lines: list[str], cols: int) -> np.ndarray:
+    """Code points of ``lines`` as a (rows, cols) array, short rows space-padded."""
+    if all(len(line) == cols for line in lines):
+        text = "".join(lines)
+    else:
+        text = "".join(line.ljust(cols) for line in lines)
+    codes = np.frombuffer(text.encode("utf-32-le"), dtype="<u4")
+    return codes.reshape(len(lines), cols)
 
 
 def render_frame_to_image(
@@ -117,41 +122,142 @@ def render_frame_to_image(
 ) -> Image.Image:
     """Render a ProcessedFrame to a PIL Image.
 
+    Glyphs come from a per-font-size atlas and are composited with NumPy,
+    so FreeType renders each distinct character once rather than every
+    frame.
+
     Args:
         frame: the processed frame with text lines.
         font_size: pixel size for the monospace font.
         bg_color: background color RGB tuple.
-        use_color: if True, parse ANSI colors from colored_lines.
+        use_color: if True, draw each character in its color from
+            frame.colors.
 
     Returns:
         PIL Image with rendered text.
     """
-    font = _get_font(font_size)
+    atlas = _glyph_atlas(font_size)
+    char_w, char_h = atlas.char_w, atlas.char_h
 
     # Calculate image dimensions
-    char_w = int(font_size * CHAR_WIDTH_RATIO)
-    char_h = font_size + 2
-    lines = frame.colored_lines if use_color else frame.lines
-    max_line_len = max((len(_strip_ansi(l)) for l in lines), default=0)
-
-    img_w = max(max_line_len * char_w, 1)
-    img_h = max(len(lines) * char_h, 1)
-
-    img = Image.new("RGB", (img_w, img_h), bg_color)
-    draw = ImageDraw.Draw(img)
-
-    for row_idx, line in enumerate(lines):
-        y = row_idx * char_h
-        if use_color and "\033" in line:
-            # Parse colored text and render char by char
-            parsed = _parse_ansi_colors(line)
-            for col_idx, (ch, color) in enumerate(parsed):
-                x = col_idx * char_w
-                draw.text((x, y), ch, fill=color, font=font)
-        else:
-            draw.text((0, y), line, fill=(255, 255, 255), font=font)
+    lines = frame.lines
+    rows = len(lines)
+    cols = max((len(l) for l in lines), default=0)
+
+    img_w = max(cols * char_w, 1)
+    img_h = max(rows * char_h, 1)
+    if rows == 0 or cols == 0:
+        return Image.new("RGB", (img_w, img_h), bg_color)
+
+    per_cell_color = use_color and frame.colors is not None
+    if not per_cell_color:
+        fg = np.array([255, 255, 255], dtype=np.uint16)
+    else:
+        colors = frame.colors[:rows, :cols]
+        if frame.color_mode == ColorMode.ANSI256:
+            # Draw the palette colors a terminal would show, not the raw samples
+            colors = ANSI256_RGB[rgb_array_to_ansi256(colors)]
+        fg = colors.astype(np.uint16)
+
+    # Each cell's index into the masks of the frame's distinct characters
+    codes, glyph_idx = np.unique(_char_grid(lines, cols), return_inverse=True)
+    masks, off_x, off_y = atlas.masks([chr(c) for c in codes.tolist()])
+    glyph_idx = glyph_idx.reshape(rows, cols)
+    tile_h, tile_w = masks.shape[1:]
+
+    # Canvas with a margin for ink spilling past the outer cells; (pad_y,
+    # pad_x) is the top-left corner of the image
+    pad_x, pad_y = atlas.pad_x, atlas.pad_y
+    canvas = np.empty(
+        ((rows + 2) * char_h + 2 * pad_y, (cols + 2) * char_w + 2 * pad_x, 3),
+        dtype=np.uint8,
+    )
+    canvas[:] = bg_color
+
+    # Drawn glyph by glyph, row by row, a cell's pixels first take the ink
+    # the row above spilled down into them, then the left neighbour's spill,
+    # the cell's own glyph, the right neighbour's spill, and finally what
+    # the row below spills up. So each tile is split into the parts below,
+    # inside and above its cell and right of, inside and left of it; within
+    # one part no two cells overlap, so each part is a single vectorized
+    # blend over the frame, and blending the nine in that order reproduces
+    # drawing the glyphs one by one.
+    #
+    # Pixels are handled as (width * channel) runs, with each mask value
+    # repeated per channel, so NumPy's inner loops cover a whole tile row
+    # rather than one pixel's three channels.
+    #
+    # Spill reaches at most the neighbouring rows, so blending bands of rows
+    # one after another, each in the order above, still draws every pixel in
+    # glyph order while the per-cell alpha and blend temporaries only ever
+    # span one band.
+    glyph_alpha = np.repeat(masks, 3, axis=2).astype(np.uint16)
+    band_rows = max(1, BLEND_BAND_BYTES // (cols * glyph_alpha[0].nbytes))
+    top, left = -off_y, -off_x
+    y_parts = ((top + char_h, tile_h), (top, top + char_h), (0, top))
+    x_parts = ((left + char_w, tile_w), (left, left + char_w), (0, left))
+    # Ink colors repeated across each part's width
+    inks = {
+        width: np.tile(fg, width)[:, None] if per_cell_color else np.tile(fg, width)
+        for width in {x_stop - x_start for x_start, x_stop in x_parts}
+        if width > 0
+    }
+    for row0 in range(0, rows, band_rows):
+        row1 = min(row0 + band_rows, rows)
+        cell_alpha = glyph_alpha[glyph_idx[row0:row1]].transpose(0, 2, 1, 3)
+        for y_start, y_stop in y_parts:
+            if y_stop <= y_start:
+                continue
+            y0 = pad_y + off_y + y_start + row0 * char_h
+            for x_start, x_stop in x_parts:
+                width = x_stop - x_start
+                if width <= 0:
+                    continue
+                x0 = pad_x + off_x + x_start
+                region = canvas[
+                    y0 : y0 + (row1 - row0) * char_h, x0 : x0 + cols * char_w
+                ].reshape(row1 - row0, char_h, cols, char_w * 3)[
+                    :, : y_stop - y_start, :, : width * 3
+                ]
+                alpha = cell_alpha[:, y_start:y_stop, :, x_start * 3 : x_stop * 3]
+                ink = inks[width][row0:row1] if per_cell_color else inks[width]
+                # Pillow's rounded blend: (dst * (255 - a) + ink * a) / 255.
+                # The weighted sum is at most 255 * 255, so uint16 cannot
+                # overflow
+                blended = region * (255 - alpha) + ink * alpha + 128
+                blended += blended >> 8
+                region[...] = blended >> 8
+
+    image = canvas[pad_y : pad_y + img_h, pad_x : pad_x + img_w]
+    return Image.fromarray(np.ascontiguousarray(image))
+
+
+def _to_palette_image(img: Image.Image, lut: np.ndarray) -> Image.Image:
+    """Convert an RGB frame to "P" mode losslessly if it has at most 256 colors.
+
+    Rendered text frames usually do (glyph colors plus their antialiased
+    edges), and mapping each pixel through a table of its exact colors is
+    several times faster than the median-cut quantization Pillow otherwise
+    runs on every RGB frame of a GIF. Frames with more colors are returned
+    unchanged for Pillow to quantize.
 
-    return img
+    Args:
+        img: the RGB frame.
+        lut: scratch uint8 array of 2**24 entries, reused across frames;
+            only the entries for this frame's colors are written and read.
+    """
+    colors = img.getcolors(256)
+    if colors is None:
+        return img
+    palette = np.array([rgb for _, rgb in colors], dtype=np.uint32)
+    # RGBX pixels read as little-endian uint32 are 0xXXBBGGRR
+    lut[palette[:, 0] | (palette[:, 1] << 8) | (palette[:, 2] << 16)] = np.arange(
+        len(colors)
+    )
+    keys = np.frombuffer(img.tobytes("raw", "RGBX"), dtype="<u4") & 0xFFFFFF
+    indexed = Image.frombytes("P", img.size, lut[keys].tobytes())
+    indexed.putpalette(palette.astype(np.uint8).tobytes())
+    return indexed
 
 
 def save_gif(
@@ -170,38 +276,47 @@ def save_gif(
         on_progress: callback(current_frame, total_frames).
         total_frames: total frame count for progress reporting.
     """
-    images: list[Image.Image] = []
-    durations: list[int] = []
-
-    for i, frame in enumerate(frames):
-        img = render_frame_to_image(frame, font_size)
-        images.append(img)
-        durations.append(frame.duration_ms)
-        if on_progress:
-            on_progress(i + 1, total_frames)
-
-    if not images:
+    frames = iter(frames)
+    first = next(frames, None)
+    if first is None:
         raise ValueError("No frames to save")
 
-    # Normalize all frames to the same size (max dimensions)
-    max_w = max(img.width for img in images)
-    max_h = max(img.height for img in images)
-    normalized = []
-    for img in images:
-        if img.width != max_w or img.height != max_h:
-            canvas = Image.new("RGB", (max_w, max_h), (0, 0, 0))
-            canvas.paste(img, (0, 0))
-            normalized.append(canvas)
-        else:
-            normalized.append(img)
-
-    normalized[0].save(
+    # Frames of one output share their settings and so their size; the
+    # first one fixes the canvas, and frames are rendered as Pillow encodes
+    lut = np.empty(1 << 24, dtype=np.uint8)
+    first_img = render_frame_to_image(first, font_size)
+    canvas_size = first_img.size
+    first_img = _to_palette_image(first_img, lut)
+    first_img.info["duration"] = first.duration_ms
+    if on_progress:
+        on_progress(1, total_frames)
+
+    def rest() -> Iterator[Image.Image]:
+        for i, frame in enumerate(frames, start=2):
+            img = render_frame_to_image(frame, font_size)
+            if img.size != canvas_size:
+                canvas = Image.new("RGB", canvas_size, (0, 0, 0))
+                canvas.paste(img, (0, 0))
+                img = canvas
+            img = _to_palette_image(img, lut)
+            # Pillow reads per-frame durations from info when none are passed
+            img.info["duration"] = frame.duration_ms
+            if on_progress:
+                on_progress(i, total_frames)
+            yield img
+
+    # Every frame covers the whole canvas, so frames can be left in place
+    # (disposal 1) and Pillow stores each one cropped to the box that changed
+    # since the previous frame; mostly static animations shrink severalfold.
+    # Pillow's optimize pass would also mask unchanged pixels inside that box
+    # as transparent, which costs more encode time than it saves in size.
+    first_img.save(
         str(output_path),
         save_all=True,
-        append_images=normalized[1:],
-        duration=durations,
+        append_images=rest(),
         loop=0,
-        disposal=2,
+        disposal=1,
+        optimize=False,
     )
 
 
@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+from dataclasses import replace
+
 from textual.app import ComposeResult
 from textual.containers import Horizontal, Vertical
 from textual.message import Message
+from textual.timer import Timer
 from textual.widget import Widget
 from textual.widgets import (
     Button,
@@ -17,8 +20,12 @@ from textual.widgets import (
 
 from ascii_maker.core.charsets import CharsetName
 from ascii_maker.core.color import ColorMode
+from ascii_maker.core.dither import DitherMethod
 from ascii_maker.core.processor import Settings
 
+# Seconds of quiet after a setting change before it is announced
+SETTINGS_DEBOUNCE_DELAY = 0.05
+
 
 class ControlPanel(Widget):
     """Settings panel with controls for ASCII conversion parameters."""
@@ -83,6 +90,7 @@ class ControlPanel(Widget):
     def __init__(self, settings: Settings | None = None, **kwargs) -> None:
         super().__init__(**kwargs)
         self._settings = settings or Settings()
+        self._settings_timer: Timer | None = None
 
     def compose(self) -> ComposeResult:
         with Vertical():
@@ -103,6 +111,12 @@ class ControlPanel(Widget):
             )
 
             yield Checkbox("Dither", value=self._settings.dither, id="dither-check")
+            yield Label("Dither method")
+            yield Select(
+                [(m.value, m.value) for m in DitherMethod],
+                value=self._settings.dither_method.value,
+                id="dither-method-select",
+            )
             yield Checkbox("Invert", value=self._settings.invert, id="invert-check")
 
             with Horizontal(classes="num-row"):
@@ -125,22 +139,34 @@ class ControlPanel(Widget):
                 )
                 yield Button("+", id="contrast-inc")
 
+    def on_mount(self) -> None:
+        self._brightness_input = self.query_one("#brightness-input", Input)
+        self._contrast_input = self.query_one("#contrast-input", Input)
+
     @property
     def settings(self) -> Settings:
         return self._settings
 
-    def _update_settings(self, **overrides) -> None:
-        """Create new settings with overrides and emit change."""
-        self._settings = Settings(
-            charset=overrides.get("charset", self._settings.charset),
-            color_mode=overrides.get("color_mode", self._settings.color_mode),
-            dither=overrides.get("dither", self._settings.dither),
-            brightness=overrides.get("brightness", self._settings.brightness),
-            contrast=overrides.get("contrast", self._settings.contrast),
-            invert=overrides.get("invert", self._settings.invert),
-            width=overrides.get("width", self._settings.width),
-            height=overrides.get("height", self._settings.height),
-        )
+    def _update_settings(self, immediate: bool = False, **overrides) -> None:
+        """Create new settings with overrides and emit change.
+
+        Every change reprocesses the current frame, so a burst of them (a
+        held +/- button) is announced once, after it settles. ``immediate``
+        announces without waiting.
+        """
+        self._settings = replace(self._settings, **overrides)
+        if self._settings_timer is not None:
+            self._settings_timer.stop()
+            self._settings_timer = None
+        if immediate:
+            self._flush_settings()
+        else:
+            self._settings_timer = self.set_timer(
+                SETTINGS_DEBOUNCE_DELAY, self._flush_settings
+            )
+
+    def _flush_settings(self) -> None:
+        self._settings_timer = None
         self.post_message(self.SettingsChanged(self._settings))
 
     def on_select_changed(self, event: Select.Changed) -> None:
@@ -148,6 +174,8 @@ class ControlPanel(Widget):
             self._update_settings(charset=CharsetName(event.value))
         elif event.select.id == "color-select" and event.value is not None:
             self._update_settings(color_mode=ColorMode(event.value))
+        elif event.select.id == "dither-method-select" and event.value is not None:
+            self._update_settings(dither_method=DitherMethod(event.value))
 
     def on_checkbox_changed(self, event: Checkbox.Changed) -> None:
         if event.checkbox.id == "dither-check":
@@ -157,18 +185,12 @@ class ControlPanel(Widget):
 
     def _adjust_brightness(self, delta: int) -> None:
         new_val = max(-100, min(100, self._settings.brightness + delta))
-        try:
-            self.query_one("#brightness-input", Input).value = str(new_val)
-        except Exception:
-            pass
+        self._brightness_input.value = str(new_val)
         self._update_settings(brightness=new_val)
 
     def _adjust_contrast(self, delta: int) -> None:
         new_val = max(0, min(200, self._settings.contrast + delta))
-        try:
-            self.query_one("#contrast-input", Input).value = str(new_val)
-        except Exception:
-            pass
+        self._contrast_input.value = str(new_val)
         self._update_settings(contrast=new_val)
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
@@ -188,19 +210,10 @@ class ControlPanel(Widget):
         except ValueError:
             return
         if event.input.id == "brightness-input":
-            self._update_settings(brightness=max(-100, min(100, val)))
+            self._update_settings(immediate=True, brightness=max(-100, min(100, val)))
         elif event.input.id == "contrast-input":
-            self._update_settings(contrast=max(0, min(200, val)))
+            self._update_settings(immediate=True, contrast=max(0, min(200, val)))
 
     def update_dimensions(self, width: int, height: int) -> None:
         """Update the target output dimensions."""
-        self._settings = Settings(
-            charset=self._settings.charset,
-            color_mode=self._settings.color_mode,
-            dither=self._settings.dither,
-            brightness=self._settings.brightness,
-            contrast=self._settings.contrast,
-            invert=self._settings.invert,
-            width=width,
-            height=height,
-        )
+        self._settings = replace(self._settings, width=width, height=height)
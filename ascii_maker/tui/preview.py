@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import re
 
 from rich.text import Text
@@ -13,41 +14,59 @@ from textual.widgets import Static
 from ascii_maker.core.processor import ProcessedFrame
 
 
+# Seconds over which frame updates are collected into one redraw; Textual
+# repaints at most 60 times a second, so frames closer together than this
+# would never be seen
+FRAME_UPDATE_INTERVAL = 1 / 60
+
+# SGR escape sequence; group 1 holds the ";"-separated parameters
+_ANSI_RE = re.compile(r"\033\[([0-9;]*)m")
+
+
+@functools.lru_cache(maxsize=4096)
+def _style_for_params(params: str) -> str | None:
+    """Rich style for an SGR parameter string, or None if it sets no color.
+
+    Cached so each distinct color is parsed and formatted once, and Rich
+    keeps getting the same style string object for it.
+    """
+    parts = params.split(";")
+    if len(parts) >= 5 and parts[0] == "38" and parts[1] == "2":
+        # Truecolor
+        return f"rgb({parts[2]},{parts[3]},{parts[4]})"
+    if len(parts) >= 3 and parts[0] == "38" and parts[1] == "5":
+        # 256-color
+        return f"color({parts[2]})"
+    if parts == ["0"]:
+        return ""
+    return None
+
+
 def _ansi_to_rich_text(ansi_line: str) -> Text:
     """Convert a string with ANSI color escapes to a Rich Text object.
 
     Handles truecolor (38;2;r;g;b) and 256-color (38;5;N) escape sequences.
     """
+    if "\033" not in ansi_line:
+        # Uncolored: nothing to parse
+        return Text(ansi_line)
+
     text = Text()
     current_style = ""
-    i = 0
-
-    while i < len(ansi_line):
-        if ansi_line[i] == "\033" and i + 1 < len(ansi_line) and ansi_line[i + 1] == "[":
-            # Parse escape sequence
-            end = ansi_line.find("m", i)
-            if end == -1:
-                i += 1
-                continue
-            seq = ansi_line[i + 2 : end]
-            parts = seq.split(";")
-
-            if len(parts) >= 5 and parts[0] == "38" and parts[1] == "2":
-                # Truecolor
-                r = parts[2] if len(parts) > 2 else "255"
-                g = parts[3] if len(parts) > 3 else "255"
-                b = parts[4] if len(parts) > 4 else "255"
-                current_style = f"rgb({r},{g},{b})"
-            elif len(parts) >= 3 and parts[0] == "38" and parts[1] == "5":
-                # 256-color
-                current_style = f"color({parts[2]})"
-            elif parts == ["0"]:
-                current_style = ""
-
-            i = end + 1
-        else:
-            text.append(ansi_line[i], style=current_style)
-            i += 1
+    last = 0
+
+    for match in _ANSI_RE.finditer(ansi_line):
+        start = match.start()
+        if start > last:
+            text.append(ansi_line[last:start], style=current_style)
+        last = match.end()
+
+        style = _style_for_params(match.group(1))
+        if style is not None:
+            current_style = style
+
+    if last < len(ansi_line):
+        text.append(ansi_line[last:], style=current_style)
 
     return text
 
@@ -82,33 +101,47 @@ class AsciiPreview(Widget):
     def __init__(self, **kwargs) -> None:
         super().__init__(**kwargs)
         self._current_frame: ProcessedFrame | None = None
+        self._pending_frame: ProcessedFrame | None = None
+        self._flush_scheduled = False
 
     def compose(self) -> ComposeResult:
         yield Static("No file loaded. Press 'o' to open a file.", id="preview-content")
 
+    def on_mount(self) -> None:
+        self._content = self.query_one("#preview-content", Static)
+
     def update_frame(self, frame: ProcessedFrame) -> None:
-        """Update the preview with a new processed frame."""
+        """Update the preview with a new processed frame.
+
+        The redraw is deferred briefly; if further frames arrive first (e.g.
+        playback outrunning the display), only the latest one is drawn.
+        """
         self._current_frame = frame
-        content = self.query_one("#preview-content", Static)
-
-        # Convert ANSI-colored lines to Rich Text
-        combined = Text()
-        for i, line in enumerate(frame.colored_lines):
-            if i > 0:
-                combined.append("\n")
-            if "\033[" in line:
-                combined.append_text(_ansi_to_rich_text(line))
-            else:
-                combined.append(line)
-
-        content.update(combined)
+        self._pending_frame = frame
+        if self._flush_scheduled:
+            return
+        self._flush_scheduled = True
+        self.set_timer(FRAME_UPDATE_INTERVAL, self._flush_frame)
+
+    def _flush_frame(self) -> None:
+        """Draw the most recent frame passed to update_frame."""
+        self._flush_scheduled = False
+        frame = self._pending_frame
+        if frame is None:
+            return
+        self._pending_frame = None
+
+        # Convert the ANSI-colored frame to Rich Text in one pass (Text, not
+        # str, so Textual does not read "[" in the art as markup)
+        combined = _ansi_to_rich_text("\n".join(frame.colored_lines))
+        self._content.update(combined)
         self.post_message(self.FrameUpdated(frame.index))
 
     def clear(self) -> None:
         """Clear the preview."""
         self._current_frame = None
-        content = self.query_one("#preview-content", Static)
-        content.update("No file loaded. Press 'o' to open a file.")
+        self._pending_frame = None
+        self._content.update("No file loaded. Press 'o' to open a file.")
 
     @property
     def current_frame(self) -> ProcessedFrame | None:
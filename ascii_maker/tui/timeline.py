@@ -85,6 +85,11 @@ class Timeline(Widget):
             id="frame-bar",
         )
 
+    def on_mount(self) -> None:
+        self._play_button = self.query_one("#btn-play", Button)
+        self._frame_label = self.query_one("#frame-label", Label)
+        self._frame_bar = self.query_one("#frame-bar", ProgressBar)
+
     def on_button_pressed(self, event: Button.Pressed) -> None:
         btn_id = event.button.id
         if btn_id == "btn-start":
@@ -102,6 +107,8 @@ class Timeline(Widget):
 
     def set_frame(self, index: int) -> None:
         """Update the displayed frame position (from playback)."""
+        if index == self._current_frame:
+            return
         self._current_frame = index
         self._update_label()
         self._update_bar()
@@ -111,31 +118,18 @@ class Timeline(Widget):
         self._total_frames = max(total, 1)
         self._current_frame = 0
         self._update_label()
-        try:
-            bar = self.query_one("#frame-bar", ProgressBar)
-            bar.update(total=self._total_frames, progress=0)
-        except Exception:
-            pass
+        self._frame_bar.update(total=self._total_frames)
+        self._update_bar()
 
     def set_playing(self, playing: bool) -> None:
         """Update play/pause button state."""
+        if playing == self._playing:
+            return
         self._playing = playing
-        try:
-            btn = self.query_one("#btn-play", Button)
-            btn.label = "||" if playing else "▶"
-        except Exception:
-            pass
+        self._play_button.label = "||" if playing else "▶"
 
     def _update_label(self) -> None:
-        try:
-            label = self.query_one("#frame-label", Label)
-            label.update(f"{self._current_frame + 1}/{self._total_frames}")
-        except Exception:
-            pass
+        self._frame_label.update(f"{self._current_frame + 1}/{self._total_frames}")
 
     def _update_bar(self) -> None:
-        try:
-            bar = self.query_one("#frame-bar", ProgressBar)
-            bar.update(progress=self._current_frame + 1)
-        except Exception:
-            pass
+        self._frame_bar.update(progress=self._current_frame + 1)
@@ -1,45 +1,56 @@
-"""LRU frame cache keyed by (frame_index, settings_hash)."""
+"""Fixed-capacity frame cache keyed by (frame_index, settings_hash)."""
 
 from __future__ import annotations
 
-from collections import OrderedDict
-from typing import TypeVar
+import threading
 
-T = TypeVar("T")
+# Entry of an unused slot; no frame has index -1, so lookups never match it
+_EMPTY: tuple[int, str | None, object] = (-1, None, None)
 
 
 class FrameCache:
-    """Simple LRU cache for processed frames.
-
-    Keys are (frame_index, settings_hash) tuples.
+    """Array-indexed cache for processed frames.
+
+    Frames live in a fixed list of slots indexed by ``frame_idx % max_size``,
+    so a lookup is one list index and two compares instead of hashing a
+    tuple key. Each slot records the settings hash its frame was processed
+    with, so a frame is only returned for the settings that produced it.
+    Frames cached for older settings are never cleared wholesale; they are
+    overwritten as frames for the new settings are stored, which also keeps
+    a worker still running with stale settings from wiping current frames.
     """
 
+    __slots__ = ("_max_size", "_slots", "_size", "_lock")
+
     def __init__(self, max_size: int = 64) -> None:
         self._max_size = max_size
-        self._cache: OrderedDict[tuple[int, str], object] = OrderedDict()
+        self._slots: list[tuple[int, str | None, object]] = [_EMPTY] * max_size
+        self._size = 0
+        # Serializes writers (preview, decode and save workers); readers
+        # only fetch one slot tuple, which is atomic
+        self._lock = threading.Lock()
 
     def get(self, frame_idx: int, settings_hash: str) -> object | None:
         """Get a cached frame, or None if not present."""
-        key = (frame_idx, settings_hash)
-        if key in self._cache:
-            self._cache.move_to_end(key)
-            return self._cache[key]
+        cached_idx, cached_hash, value = self._slots[frame_idx % self._max_size]
+        if cached_idx == frame_idx and cached_hash == settings_hash:
+            return value
         return None
 
     def put(self, frame_idx: int, settings_hash: str, value: object) -> None:
-        """Cache a processed frame."""
-        key = (frame_idx, settings_hash)
-        if key in self._cache:
-            self._cache.move_to_end(key)
-        else:
-            if len(self._cache) >= self._max_size:
-                self._cache.popitem(last=False)
-        self._cache[key] = value
+        """Cache a processed frame, evicting whichever frame shares its slot."""
+        slot = frame_idx % self._max_size
+        with self._lock:
+            if self._slots[slot] is _EMPTY:
+                self._size += 1
+            self._slots[slot] = (frame_idx, settings_hash, value)
 
     def clear(self) -> None:
         """Clear the entire cache."""
-        self._cache.clear()
+        with self._lock:
+            self._slots = [_EMPTY] * self._max_size
+            self._size = 0
 
     @property
     def size(self) -> int:
-        return len(self._cache)
+        return self._size
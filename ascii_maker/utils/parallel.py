@@ -0,0 +1,113 @@
+"""Thread-based helpers for overlapping stages of frame pipelines."""
+
+from __future__ import annotations
+
+import os
+import queue
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Iterable, Iterator, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def default_workers() -> int:
+    """Worker count for frame processing: one per core, capped at 4."""
+    return max(1, min(4, os.cpu_count() or 1))
+
+
+def map_ordered(
+    func: Callable[[T], R],
+    items: Iterable[T],
+    max_workers: int | None = None,
+) -> Iterator[R]:
+    """Apply ``func`` to ``items`` on a thread pool, yielding results in order.
+
+    At most ``2 * max_workers`` items are in flight, so memory stays bounded
+    however long the input is. NumPy, Pillow and OpenCV release the GIL in
+    their C code, which is where frame processing spends its time.
+
+    With ``max_workers=1`` no threads are started. Outstanding work is
+    cancelled if the consumer stops early or ``func`` raises.
+    """
+    workers = max_workers if max_workers is not None else default_workers()
+    if workers <= 1:
+        for item in items:
+            yield func(item)
+        return
+
+    depth = workers * 2
+    pending: deque[Future[R]] = deque()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        try:
+            for item in items:
+                pending.append(pool.submit(func, item))
+                if len(pending) >= depth:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+class _Failure:
+    """Carries an exception from the prefetch thread to the consumer."""
+
+    def __init__(self, error: BaseException) -> None:
+        self.error = error
+
+
+_DONE = object()
+
+
+def prefetch(items: Iterable[T], depth: int = 4) -> Iterator[T]:
+    """Iterate ``items`` on a background thread, handing them over a bounded queue.
+
+    Whatever work producing each item involves (decoding, processing) runs
+    concurrently with the consumer (typically an encoder), with at most
+    ``depth`` items buffered between them. Exceptions raised while producing
+    are re-raised in the consumer. If the consumer stops early, the producer
+    is told to stop and the source iterator is closed.
+    """
+    handoff: queue.Queue[object] = queue.Queue(maxsize=depth)
+    stop = threading.Event()
+    source = iter(items)
+
+    def put(item: object) -> bool:
+        while not stop.is_set():
+            try:
+                handoff.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce() -> None:
+        try:
+            for item in source:
+                if not put(item):
+                    return
+            put(_DONE)
+        except BaseException as e:
+            put(_Failure(e))
+        finally:
+            close = getattr(source, "close", None)
+            if close is not None:
+                close()
+
+    thread = threading.Thread(target=produce, name="prefetch", daemon=True)
+    thread.start()
+    try:
+        while True:
+            item = handoff.get()
+            if item is _DONE:
+                return
+            if isinstance(item, _Failure):
+                raise item.error
+            yield item
+    finally:
+        stop.set()
+        thread.join()
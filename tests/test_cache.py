@@ -0,0 +1,51 @@
+"""Tests for the processed-frame cache."""
+
+from ascii_maker.utils.cache import FrameCache
+
+
+class TestFrameCache:
+    def test_miss_returns_none(self):
+        cache = FrameCache(max_size=4)
+        assert cache.get(0, "abc") is None
+
+    def test_put_then_get(self):
+        cache = FrameCache(max_size=4)
+        cache.put(2, "abc", "frame2")
+        assert cache.get(2, "abc") == "frame2"
+        assert cache.size == 1
+
+    def test_other_hash_misses(self):
+        cache = FrameCache(max_size=4)
+        cache.put(0, "abc", "frame0")
+        assert cache.get(0, "def") is None
+
+    def test_new_hash_replaces_slot(self):
+        cache = FrameCache(max_size=4)
+        cache.put(0, "abc", "frame0")
+        cache.put(0, "def", "new0")
+        assert cache.get(0, "def") == "new0"
+        assert cache.get(0, "abc") is None
+        assert cache.size == 1
+
+    def test_stale_put_keeps_current_frames(self):
+        cache = FrameCache(max_size=4)
+        cache.put(0, "new", "new0")
+        # A worker still running with the old settings stores its frame
+        cache.put(1, "old", "old1")
+        assert cache.get(0, "new") == "new0"
+        assert cache.get(1, "new") is None
+
+    def test_colliding_slot_evicts(self):
+        cache = FrameCache(max_size=4)
+        cache.put(1, "abc", "frame1")
+        cache.put(5, "abc", "frame5")
+        assert cache.get(1, "abc") is None
+        assert cache.get(5, "abc") == "frame5"
+        assert cache.size == 1
+
+    def test_clear(self):
+        cache = FrameCache(max_size=4)
+        cache.put(0, "abc", "frame0")
+        cache.clear()
+        assert cache.get(0, "abc") is None
+        assert cache.size == 0
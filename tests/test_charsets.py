@@ -9,6 +9,7 @@ from ascii_maker.core.charsets import (
     braille_char,
     braille_from_array,
 )
+from ascii_maker.core.dither import floyd_steinberg
 
 
 class TestCharsets:
@@ -50,6 +51,30 @@ class TestCharsets:
         for line in lines:
             assert line == cs.chars[-1] * 5
 
+    def test_map_array_row_major_order(self):
+        """Each line should read its row left to right."""
+        cs = CHARSETS[CharsetName.SIMPLE]
+        arr = np.linspace(0.0, 1.0, 24).reshape(4, 6)
+        lines = cs.map_array(arr)
+        expected = [
+            "".join(cs.char_for_luminance(v) for v in row) for row in arr
+        ]
+        assert lines == expected
+
+    def test_map_array_zero_width(self):
+        cs = CHARSETS[CharsetName.SIMPLE]
+        assert cs.map_array(np.zeros((3, 0))) == ["", "", ""]
+
+    def test_map_array_quantized_matches_dither_levels(self):
+        cs = CHARSETS[CharsetName.DETAILED]
+        levels = len(cs.chars)
+        gray = np.random.default_rng(0).random((60, 80), dtype=np.float32)
+        dithered = floyd_steinberg(gray, levels=levels)
+        # Each dithered level maps to the character of that level
+        expected = np.rint(dithered * (levels - 1)).astype(int)
+        lines = cs.map_array(dithered, quantized=True)
+        assert lines == ["".join(cs.chars[i] for i in row) for row in expected]
+
     def test_detailed_charset_length(self):
         cs = CHARSETS[CharsetName.DETAILED]
         assert len(cs.chars) > 20  # Should have many characters
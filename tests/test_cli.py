@@ -0,0 +1,49 @@
+"""Tests for the command-line interface."""
+
+import json
+import subprocess
+import sys
+
+import pytest
+from PIL import Image
+
+
+@pytest.fixture
+def sample_gif(tmp_path):
+    path = tmp_path / "test.gif"
+    frames = [Image.new("RGB", (20, 20), (i * 100, 0, 0)) for i in range(2)]
+    frames[0].save(str(path), save_all=True, append_images=frames[1:], duration=100)
+    return path
+
+
+class TestHeadlessConvert:
+    def test_json_convert_does_not_import_textual(self, sample_gif, tmp_path):
+        """The headless path must stay free of TUI imports."""
+        output = tmp_path / "out.gif"
+        script = (
+            "import sys\n"
+            "from ascii_maker.cli import main\n"
+            f"sys.argv = ['ascii-maker', 'convert', {str(sample_gif)!r},"
+            f" '-o', {str(output)!r}, '--json', '--width', '10', '--height', '5']\n"
+            "main()\n"
+            "assert 'textual' not in sys.modules, 'textual was imported'\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", script], capture_output=True, text=True
+        )
+        assert result.returncode == 0, result.stderr
+        assert json.loads(result.stdout)["status"] == "success"
+        assert output.exists()
+
+    def test_missing_file_json_error(self, tmp_path):
+        script = (
+            "import sys\n"
+            "from ascii_maker.cli import main\n"
+            f"sys.argv = ['ascii-maker', 'convert', {str(tmp_path / 'nope.gif')!r}, '--json']\n"
+            "main()\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", script], capture_output=True, text=True
+        )
+        assert result.returncode == 1
+        assert json.loads(result.stderr)["code"] == "FILE_NOT_FOUND"
@@ -8,6 +8,8 @@ from ascii_maker.core.color import (
     ColorMode,
     colorize_char,
     colorize_line,
+    colorize_lines,
+    rgb_array_to_ansi256,
     rgb_to_ansi256,
     truecolor_fg,
     ansi256_fg,
@@ -36,6 +38,16 @@ class TestRgbToAnsi256:
     def test_returns_int(self):
         assert isinstance(rgb_to_ansi256(100, 150, 200), int)
 
+    def test_array_matches_scalar(self):
+        rng = np.random.default_rng(0)
+        colors = rng.integers(0, 256, size=(500, 3), dtype=np.uint8)
+        # Include near-gray colors that take the grayscale-ramp branch
+        colors[:100, 1] = colors[:100, 0]
+        colors[:100, 2] = colors[:100, 0]
+        result = rgb_array_to_ansi256(colors)
+        expected = [rgb_to_ansi256(*map(int, c)) for c in colors]
+        assert result.tolist() == expected
+
 
 class TestEscapes:
     def test_truecolor_format(self):
@@ -82,3 +94,17 @@ class TestColorize:
         result = colorize_line("AB", colors, ColorMode.TRUECOLOR)
         # Should have exactly one color escape (plus one reset)
         assert result.count("\033[38;2;255;0;0m") == 1
+
+    def test_colorize_line_repeated_rows_share_output(self):
+        colors = np.array([[10, 200, 30]] * 5, dtype=np.uint8)
+        first = colorize_line("abcde", colors, ColorMode.TRUECOLOR)
+        second = colorize_line("abcde", colors.copy(), ColorMode.TRUECOLOR)
+        assert first is second
+
+    @pytest.mark.parametrize("mode", list(ColorMode))
+    def test_colorize_lines_matches_colorize_line(self, mode):
+        rng = np.random.default_rng(3)
+        colors = (rng.integers(0, 3, (6, 12, 3)) * 120).astype(np.uint8)
+        lines = ["abcdefghijkl"] * 5 + [""]
+        expected = [colorize_line(line, colors[i], mode) for i, line in enumerate(lines)]
+        assert colorize_lines(lines, colors, mode) == expected
@@ -1,9 +1,15 @@
-"""Tests for Floyd-Steinberg dithering."""
+"""Tests for Floyd-Steinberg and ordered dithering."""
 
 import numpy as np
 import pytest
 
-from ascii_maker.core.dither import floyd_steinberg
+from ascii_maker.core.dither import (
+    BAYER8,
+    _diffuse_errors,
+    _diffuse_errors_fast,
+    floyd_steinberg,
+    ordered_dither,
+)
 
 
 class TestFloydSteinberg:
@@ -53,3 +59,46 @@ class TestFloydSteinberg:
         result = floyd_steinberg(gray, levels=2)
         # Mean should be approximately 0.5 (within tolerance for error diffusion)
         assert abs(result.mean() - 0.5) < 0.15
+
+    def test_fast_kernel_matches_reference(self):
+        """The compiled kernel (when Numba is installed) must match the Python loop."""
+        gray = np.random.rand(12, 17)
+        for levels in (2, 4, 10):
+            step = 1.0 / (levels - 1)
+            expected = gray.copy()
+            _diffuse_errors(expected, step)
+            actual = gray.copy()
+            _diffuse_errors_fast(actual, step)
+            assert np.allclose(actual, expected)
+
+
+class TestOrderedDither:
+    def test_bayer_matrix_is_a_permutation(self):
+        assert BAYER8.shape == (8, 8)
+        assert sorted(BAYER8.ravel().tolist()) == list(range(64))
+
+    def test_binary_only_two_values(self):
+        gray = np.random.rand(10, 10)
+        result = ordered_dither(gray, levels=2)
+        assert set(np.unique(result).tolist()) <= {0.0, 1.0}
+
+    def test_extremes_unchanged(self):
+        assert np.allclose(ordered_dither(np.zeros((5, 5)), levels=2), 0.0)
+        assert np.allclose(ordered_dither(np.ones((5, 5)), levels=2), 1.0)
+
+    def test_multi_level(self):
+        gray = np.linspace(0, 1, 100).reshape(10, 10)
+        result = ordered_dither(gray, levels=4)
+        assert len(np.unique(np.round(result, 2))) <= 4
+
+    def test_preserves_shape_and_dtype(self):
+        gray = np.random.rand(15, 20).astype(np.float32)
+        result = ordered_dither(gray, levels=2)
+        assert result.shape == (15, 20)
+        assert result.dtype == np.float32
+
+    def test_mean_preservation(self):
+        """A full 8x8 tile reproduces flat gray levels exactly."""
+        for value in (0.25, 0.5, 0.75):
+            gray = np.full((16, 16), value)
+            assert ordered_dither(gray, levels=2).mean() == pytest.approx(value)
@@ -0,0 +1,94 @@
+"""Tests for the ordered thread-pool map."""
+
+import threading
+import time
+
+import pytest
+
+from ascii_maker.utils.parallel import map_ordered, prefetch
+
+
+class TestMapOrdered:
+    def test_preserves_order(self):
+        def slow_square(x):
+            # Later items finish first
+            time.sleep((10 - x) * 0.001)
+            return x * x
+
+        assert list(map_ordered(slow_square, range(10), max_workers=4)) == [
+            x * x for x in range(10)
+        ]
+
+    def test_single_worker_runs_inline(self):
+        threads = set()
+
+        def record(x):
+            threads.add(threading.get_ident())
+            return x
+
+        assert list(map_ordered(record, range(5), max_workers=1)) == list(range(5))
+        assert threads == {threading.get_ident()}
+
+    def test_propagates_errors(self):
+        def fail_on_three(x):
+            if x == 3:
+                raise ValueError("boom")
+            return x
+
+        with pytest.raises(ValueError, match="boom"):
+            list(map_ordered(fail_on_three, range(10), max_workers=2))
+
+    def test_bounded_lookahead(self):
+        consumed = []
+
+        def items():
+            for i in range(100):
+                consumed.append(i)
+                yield i
+
+        results = map_ordered(lambda x: x, items(), max_workers=2)
+        assert next(results) == 0
+        # At most 2 * max_workers items are pulled ahead of the consumer
+        assert len(consumed) <= 4
+        results.close()
+
+
+class TestPrefetch:
+    def test_yields_all_items_in_order(self):
+        assert list(prefetch(iter(range(20)), depth=3)) == list(range(20))
+
+    def test_produces_on_another_thread(self):
+        threads = []
+
+        def items():
+            for i in range(3):
+                threads.append(threading.get_ident())
+                yield i
+
+        assert list(prefetch(items())) == [0, 1, 2]
+        assert threading.get_ident() not in threads
+
+    def test_propagates_errors(self):
+        def items():
+            yield 1
+            raise ValueError("boom")
+
+        results = prefetch(items())
+        assert next(results) == 1
+        with pytest.raises(ValueError, match="boom"):
+            next(results)
+
+    def test_early_close_stops_producer(self):
+        closed = threading.Event()
+
+        def items():
+            try:
+                for i in range(1000):
+                    yield i
+            finally:
+                closed.set()
+
+        results = prefetch(items(), depth=2)
+        assert next(results) == 0
+        results.close()
+        assert closed.is_set()
@@ -6,6 +6,7 @@ from PIL import Image
 
 from ascii_maker.core.charsets import CharsetName
 from ascii_maker.core.color import ColorMode
+from ascii_maker.core.dither import DitherMethod
 from ascii_maker.core.processor import (
     ProcessedFrame,
     Settings,
@@ -78,6 +79,21 @@ class TestProcessFrame:
         result = process_frame(frame, settings)
         assert len(result.lines) == 10
 
+    def test_ordered_dither_output(self):
+        frame = _make_test_frame()
+        fs = Settings(width=20, height=10, dither=True, color_mode=ColorMode.NONE)
+        bayer = Settings(
+            width=20,
+            height=10,
+            dither=True,
+            dither_method=DitherMethod.BAYER,
+            color_mode=ColorMode.NONE,
+        )
+        assert fs.hash() != bayer.hash()
+        result = process_frame(frame, bayer)
+        assert len(result.lines) == 10
+        assert all(len(line) == 20 for line in result.lines)
+
     def test_inverted_output(self):
         frame = _make_test_frame(color=(0, 0, 0))  # Black
         s_normal = Settings(width=10, height=5, color_mode=ColorMode.NONE)
@@ -3,6 +3,7 @@
 import tempfile
 from pathlib import Path
 
+import cv2
 import numpy as np
 import pytest
 from PIL import Image
@@ -11,7 +12,9 @@ from ascii_maker.core.reader import (
     Frame,
     GifReader,
     MediaInfo,
+    Mp4Reader,
     detect_format,
+    download_media,
     open_media,
 )
 
@@ -81,6 +84,98 @@ class TestGifReader:
         assert frame.index == 1
         assert frame.image.mode == "RGB"
 
+    def test_gif_seek_matches_frames(self, sample_gif):
+        reader = GifReader(sample_gif)
+        expected = [np.asarray(f.image) for f in reader.frames()]
+        # Forward, backward and repeated seeks all composite correctly
+        for idx in [0, 1, 2, 1, 0, 2, 2]:
+            frame = reader.seek(idx)
+            assert frame.index == idx
+            assert np.array_equal(np.asarray(frame.image), expected[idx])
+
+    def test_gif_seek_out_of_range(self, sample_gif):
+        with pytest.raises(IndexError):
+            GifReader(sample_gif).seek(3)
+
+    def test_close_drops_seek_state(self, sample_gif):
+        with GifReader(sample_gif) as reader:
+            reader.seek(1)
+        assert reader._seek_frames is None
+        assert not reader._recent
+
+
+class TestMp4Reader:
+    @pytest.fixture
+    def sample_mp4(self, tmp_path):
+        """Write a short 3-frame MP4 with OpenCV."""
+        path = tmp_path / "test.mp4"
+        writer = cv2.VideoWriter(
+            str(path), cv2.VideoWriter_fourcc(*"mp4v"), 10.0, (32, 32)
+        )
+        for i in range(3):
+            writer.write(np.full((32, 32, 3), i * 80, dtype=np.uint8))
+        writer.release()
+        return path
+
+    def test_frames_are_rgb_arrays(self, sample_mp4):
+        reader = Mp4Reader(sample_mp4)
+        frames = list(reader.frames())
+        assert len(frames) == 3
+        for i, frame in enumerate(frames):
+            assert frame.index == i
+            assert isinstance(frame.image, np.ndarray)
+            assert frame.image.shape == (32, 32, 3)
+            assert frame.image.dtype == np.uint8
+
+    def test_seek(self, sample_mp4):
+        frame = Mp4Reader(sample_mp4).seek(1)
+        assert frame.index == 1
+        assert isinstance(frame.image, np.ndarray)
+
+    def test_seek_matches_frames(self, sample_mp4):
+        reader = Mp4Reader(sample_mp4)
+        expected = [f.image for f in reader.frames()]
+        # Sequential reads and repositioning both return the right frame
+        for idx in [0, 1, 2, 0, 2, 1]:
+            assert np.array_equal(reader.seek(idx).image, expected[idx])
+
+    def test_close_releases_seek_capture(self, sample_mp4):
+        with Mp4Reader(sample_mp4) as reader:
+            reader.seek(0)
+            assert reader._seek_cap is not None
+        assert reader._seek_cap is None
+        # Seeking again after close reopens the capture
+        assert reader.seek(1).index == 1
+        reader.close()
+
+
+class TestDownloadMedia:
+    def test_copies_content(self, tmp_path):
+        src = tmp_path / "src.gif"
+        src.write_bytes(b"GIF89a" + bytes(range(256)) * 10)
+
+        path = download_media(src.as_uri())
+        try:
+            assert path.read_bytes() == src.read_bytes()
+        finally:
+            path.unlink()
+
+    def test_reports_progress(self, tmp_path):
+        src = tmp_path / "src.gif"
+        src.write_bytes(b"x" * 5000)
+        progress = []
+
+        path = download_media(src.as_uri(), on_progress=lambda d, t: progress.append((d, t)))
+        path.unlink()
+
+        assert progress[-1] == (5000, 5000)
+
+    def test_empty_download_raises(self, tmp_path):
+        src = tmp_path / "empty.gif"
+        src.write_bytes(b"")
+        with pytest.raises(ValueError, match="empty"):
+            download_media(src.as_uri())
+
 
 class TestOpenMedia:
     def test_file_not_found(self):
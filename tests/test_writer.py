@@ -3,13 +3,19 @@
 import tempfile
 from pathlib import Path
 
+import numpy as np
 import pytest
-from PIL import Image
+from PIL import Image, ImageDraw
 
+from ascii_maker.core import writer
+from ascii_maker.core.charsets import CharsetName
+from ascii_maker.core.color import ColorMode
 from ascii_maker.core.processor import ProcessedFrame, Settings, process_frame
 from ascii_maker.core.reader import Frame
 from ascii_maker.core.writer import (
-    _strip_ansi,
+    CHAR_WIDTH_RATIO,
+    _get_font,
+    _to_palette_image,
     render_frame_to_image,
     save_gif,
 )
@@ -23,19 +29,6 @@ def _make_processed_frame(width=20, height=10, index=0):
     return process_frame(raw, settings)
 
 
-class TestStripAnsi:
-    def test_no_ansi(self):
-        assert _strip_ansi("hello world") == "hello world"
-
-    def test_with_color(self):
-        text = "\033[38;2;255;0;0mX\033[0m"
-        assert _strip_ansi(text) == "X"
-
-    def test_with_256_color(self):
-        text = "\033[38;5;196mA\033[0m"
-        assert _strip_ansi(text) == "A"
-
-
 class TestRenderFrame:
     def test_produces_image(self):
         frame = _make_processed_frame()
@@ -50,6 +43,48 @@ class TestRenderFrame:
         img = render_frame_to_image(frame, use_color=False)
         assert isinstance(img, Image.Image)
 
+    @pytest.mark.parametrize("mode", [ColorMode.TRUECOLOR, ColorMode.ANSI256])
+    def test_draws_frame_colors(self, mode):
+        img = Image.new("RGB", (100, 100), (255, 0, 0))
+        raw = Frame(image=img, duration_ms=100, index=0)
+        frame = process_frame(raw, Settings(color_mode=mode, width=20, height=8))
+        assert frame.colors.shape == (8, 20, 3)
+        rendered = np.asarray(render_frame_to_image(frame))
+        assert rendered[..., 0].max() > 0
+        assert rendered[..., 1:].max() == 0
+
+    @pytest.mark.parametrize("charset", list(CharsetName))
+    def test_matches_drawing_each_glyph(self, charset):
+        rng = np.random.default_rng(0)
+        pixels = rng.integers(0, 256, (60, 60, 3), dtype=np.uint8)
+        raw = Frame(image=pixels, duration_ms=100, index=0)
+        frame = process_frame(raw, Settings(charset=charset, width=12, height=5))
+
+        font_size = 14
+        font = _get_font(font_size)
+        char_w, char_h = int(font_size * CHAR_WIDTH_RATIO), font_size + 2
+        expected = Image.new("RGB", (12 * char_w, 5 * char_h), (0, 0, 0))
+        draw = ImageDraw.Draw(expected)
+        for row, line in enumerate(frame.lines):
+            for col, ch in enumerate(line):
+                color = tuple(int(c) for c in frame.colors[row, col])
+                draw.text((col * char_w, row * char_h), ch, fill=color, font=font)
+
+        rendered = render_frame_to_image(frame, font_size)
+        assert np.array_equal(np.asarray(rendered), np.asarray(expected))
+
+    def test_row_bands_match_whole_frame(self, monkeypatch):
+        rng = np.random.default_rng(0)
+        pixels = rng.integers(0, 256, (60, 60, 3), dtype=np.uint8)
+        raw = Frame(image=pixels, duration_ms=100, index=0)
+        frame = process_frame(
+            raw, Settings(charset=CharsetName.BLOCKS, width=12, height=5)
+        )
+        whole = np.asarray(render_frame_to_image(frame))
+        # One row per band
+        monkeypatch.setattr(writer, "BLEND_BAND_BYTES", 1)
+        assert np.array_equal(np.asarray(render_frame_to_image(frame)), whole)
+
 
 class TestSaveGif:
     def test_save_single_frame_gif(self, tmp_path):
@@ -82,6 +117,74 @@ class TestSaveGif:
         # Check it's animated
         assert getattr(img, "n_frames", 1) == 3
 
+    def test_frame_durations_preserved(self, tmp_path):
+        colors = [(255, 0, 0), (0, 255, 0), (0, 0, 255)]
+        durations = [40, 120, 70]
+        frames = [
+            process_frame(
+                Frame(image=Image.new("RGB", (100, 100), c), duration_ms=d, index=i),
+                Settings(width=20, height=10),
+            )
+            for i, (c, d) in enumerate(zip(colors, durations))
+        ]
+        output = tmp_path / "test_durations.gif"
+
+        save_gif(iter(frames), output)
+
+        img = Image.open(str(output))
+        saved = []
+        for i in range(img.n_frames):
+            img.seek(i)
+            saved.append(img.info["duration"])
+        assert saved == durations
+
+    def test_frames_saved_losslessly(self, tmp_path):
+        frames = [
+            process_frame(
+                Frame(image=Image.new("RGB", (100, 100), c), duration_ms=100, index=i),
+                Settings(width=20, height=10),
+            )
+            for i, c in enumerate([(255, 0, 0), (30, 200, 90)])
+        ]
+        output = tmp_path / "test_lossless.gif"
+
+        save_gif(iter(frames), output)
+
+        img = Image.open(str(output))
+        for i, frame in enumerate(frames):
+            img.seek(i)
+            expected = np.asarray(render_frame_to_image(frame))
+            assert np.array_equal(np.asarray(img.convert("RGB")), expected)
+
+    def test_stores_only_changed_region(self, tmp_path):
+        still = np.zeros((100, 100, 3), dtype=np.uint8)
+        changed = still.copy()
+        changed[40:50, 40:50] = 255
+        settings = Settings(width=20, height=10, color_mode=ColorMode.NONE)
+        frames = [
+            process_frame(Frame(image=rgb, duration_ms=100, index=i), settings)
+            for i, rgb in enumerate([still, changed])
+        ]
+        output = tmp_path / "test_delta.gif"
+
+        save_gif(iter(frames), output)
+
+        img = Image.open(str(output))
+        img.seek(1)
+        left, top, right, bottom = img.dispose_extent
+        assert (right - left) * (bottom - top) < img.width * img.height // 4
+        expected = np.asarray(render_frame_to_image(frames[1]))
+        assert np.array_equal(np.asarray(img.convert("RGB")), expected)
+
+    def test_palette_image_skips_many_colors(self):
+        lut = np.empty(1 << 24, dtype=np.uint8)
+        few = Image.new("RGB", (4, 4), (10, 20, 30))
+        assert _to_palette_image(few, lut).mode == "P"
+        idx = np.arange(32 * 32)
+        rgb = np.stack([idx % 256, idx // 256, np.zeros_like(idx)], axis=-1)
+        many = Image.fromarray(rgb.astype(np.uint8).reshape(32, 32, 3))
+        assert _to_palette_image(many, lut) is many
+
     def test_progress_callback(self, tmp_path):
         frames = [_make_processed_frame(index=i) for i in range(3)]
         output = tmp_path / "test_progress.gif"